@@ -199,12 +199,13 @@ class AirportRenderer:
     def reset_simulation(self):
         """Reset the simulation."""
         self.simulation.stop()
-        self.airport.aircraft.clear()
+        self.airport.clear_aircraft()
         for runway in self.airport.runways:
             runway.state = RunwayState.AVAILABLE
             runway.occupied_by = None
         for gate in self.airport.gates:
             gate.occupied_by = None
+        self.simulation.scheduler.reset()
         self.selected_aircraft = None
     
 
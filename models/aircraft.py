@@ -11,11 +11,31 @@ import random
 import uuid
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from .position import Position
 
 
+# Fuel percentages below which an aircraft is low / critical on fuel
+_LOW_FUEL_THRESHOLD = 25.0
+_CRITICAL_FUEL_THRESHOLD = 15.0
+
+
+def _crosses_fuel_threshold(before: float, after: float) -> bool:
+    """
+    Check whether a fuel change moved an aircraft across the low or critical threshold.
+    
+    Args:
+        before (float): Fuel percentage before the change
+        after (float): Fuel percentage after the change
+        
+    Returns:
+        bool: True if the fuel emergency level changed
+    """
+    return ((before < _LOW_FUEL_THRESHOLD) != (after < _LOW_FUEL_THRESHOLD) or
+            (before < _CRITICAL_FUEL_THRESHOLD) != (after < _CRITICAL_FUEL_THRESHOLD))
+
+
 class AircraftState(Enum):
     """
     Enumeration of possible aircraft states in the simulation.
@@ -103,14 +123,22 @@ class Aircraft:
     refuel_start_time: Optional[float] = None  # When refueling started
     refuel_completed: bool = False  # Whether refueling is finished
     
+    # Departure waiting in the ground holding area for a runway
+    waiting_for_runway: bool = False
+    
     # Crash information
     crash_reason: Optional[str] = None
+    
+    # Fuel log throttle keys (critical, low, holding), built once from the id
+    fuel_log_keys: Tuple[str, str, str] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Initialize derived attributes after dataclass creation."""
         # Set passenger count based on aircraft type if not already set
         if self.passenger_count == 0:
             self.passenger_count = self._generate_passenger_count()
+        
+        self.fuel_log_keys = (f"critical_{self.id}", f"low_{self.id}", f"holding_{self.id}")
     
     def _generate_passenger_count(self) -> int:
         """
@@ -156,14 +184,18 @@ class Aircraft:
         
         print(f"GATE OPERATIONS: {self.callsign} starting refuel from {self.fuel:.1f}% to {self.target_fuel_level:.1f}%")
     
-    def update_refueling(self, current_time: float, dt: float):
+    def update_refueling(self, current_time: float, dt: float) -> bool:
         """
         Update fuel refilling process during gate operations.
         
         Args:
             current_time (float): Current simulation time
             dt (float): Time step in seconds
+            
+        Returns:
+            bool: True if refueling moved the aircraft across a fuel threshold
         """
+        fuel_before = self.fuel
         if (self.state == AircraftState.BOARDING_DEBOARDING and 
             not self.refuel_completed and 
             self.refuel_start_time is not None and
@@ -196,6 +228,8 @@ class Aircraft:
                 refuel_progress = time_refueling / refuel_time
                 current_fuel_target = self.fuel_at_arrival + (fuel_needed * refuel_progress)
                 self.fuel = min(self.target_fuel_level, current_fuel_target)
+        
+        return _crosses_fuel_threshold(fuel_before, self.fuel)
     
     def get_refuel_time(self) -> float:
         """
@@ -294,12 +328,15 @@ class Aircraft:
         
         return " | ".join(status_parts)
 
-    def update(self, dt: float) -> None:
+    def update(self, dt: float) -> bool:
         """
         Update aircraft position, fuel consumption, and other time-based changes.
         
         Args:
             dt (float): Time step in seconds since last update
+            
+        Returns:
+            bool: True if fuel consumption moved the aircraft across a fuel threshold
         """
         # Move towards target position
         if self.position.distance_to(self.target_position) > 5:
@@ -340,10 +377,12 @@ class Aircraft:
         if self.state == AircraftState.BOARDING_DEBOARDING:
             # During boarding/deboarding, handle refueling but no fuel consumption (engines off)
             # Note: refueling is handled by the state manager calling update_refueling()
-            pass
-        else:
-            # Normal fuel consumption for other states
-            self._consume_fuel(dt)
+            return False
+        
+        # Normal fuel consumption for other states
+        fuel_before = self.fuel
+        self._consume_fuel(dt)
+        return _crosses_fuel_threshold(fuel_before, self.fuel)
 
     def _consume_fuel(self, dt: float) -> None:
         """
@@ -371,7 +410,7 @@ class Aircraft:
         
         # Special handling for HOLDING state based on whether aircraft is airborne or ground
         if self.state == AircraftState.HOLDING:
-            if hasattr(self, 'waiting_for_runway') and self.waiting_for_runway:
+            if self.waiting_for_runway:
                 # Ground holding (waiting for takeoff runway) - minimal fuel consumption
                 rate = 0.05  # 0.05% per second (engines idling on ground)
             else:
@@ -394,7 +433,7 @@ class Aircraft:
         """
         if self.state == AircraftState.HOLDING:
             # Aircraft already in holding - check if it can continue
-            if hasattr(self, 'waiting_for_runway') and self.waiting_for_runway:
+            if self.waiting_for_runway:
                 # Ground holding - very low fuel consumption
                 fuel_needed = 0.05 * (holding_time_minutes * 60) + 5.0  # 5% safety margin
             else:
@@ -402,7 +441,7 @@ class Aircraft:
                 fuel_needed = 0.20 * (holding_time_minutes * 60) + 10.0  # 10% safety margin
         else:
             # Aircraft considering entering holding
-            if hasattr(self, 'waiting_for_runway'):
+            if self.waiting_for_runway:
                 # Would be ground holding
                 fuel_needed = 0.05 * (holding_time_minutes * 60) + 5.0
             else:
@@ -418,7 +457,7 @@ class Aircraft:
         Returns:
             float: Maximum safe holding time in minutes
         """
-        if hasattr(self, 'waiting_for_runway') and self.waiting_for_runway:
+        if self.waiting_for_runway:
             # Ground holding calculation
             safety_margin = 5.0  # Keep 5% fuel as safety margin
             available_fuel = max(0, self.fuel - safety_margin)
@@ -464,7 +503,7 @@ class Aircraft:
         Returns:
             bool: True if fuel is below 25% (low fuel threshold)
         """
-        return self.fuel < 25.0
+        return self.fuel < _LOW_FUEL_THRESHOLD
 
     def is_critical_fuel(self) -> bool:
         """
@@ -473,7 +512,7 @@ class Aircraft:
         Returns:
             bool: True if fuel is below 15% (critical fuel threshold)
         """
-        return self.fuel < 15.0
+        return self.fuel < _CRITICAL_FUEL_THRESHOLD
 
     def distance_to(self, other: 'Aircraft') -> float:
         """
@@ -520,7 +559,7 @@ class Aircraft:
             if self.state not in mobile_states or other.state not in mobile_states:
                 return False
         
-        return self.distance_to(other) <= collision_distance
+        return self.position.distance_sq_to(other.position) <= collision_distance * collision_distance
 
     def is_collision_imminent(self, other: 'Aircraft', warning_distance: float = 500.0) -> bool:
         """
@@ -545,9 +584,9 @@ class Aircraft:
             return False
         
         # Don't trigger avoidance for aircraft very close to completing landing sequence
-        if self.state == AircraftState.LANDING and self.position.distance_to(self.target_position) < 20:
+        if self.state == AircraftState.LANDING and self.position.distance_sq_to(self.target_position) < 400:
             return False
-        if other.state == AircraftState.LANDING and other.position.distance_to(other.target_position) < 20:
+        if other.state == AircraftState.LANDING and other.position.distance_sq_to(other.target_position) < 400:
             return False
         
         # Only check for moving aircraft
@@ -559,7 +598,7 @@ class Aircraft:
         if self.state not in moving_states or other.state not in moving_states:
             return False
         
-        return self.distance_to(other) <= warning_distance
+        return self.position.distance_sq_to(other.position) <= warning_distance * warning_distance
 
     def get_boarding_time(self) -> float:
         """
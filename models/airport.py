@@ -6,6 +6,7 @@ the physical infrastructure and operational components of the airport
 in the simulation.
 """
 
+import math
 import random
 import uuid
 from dataclasses import dataclass, field
@@ -16,6 +17,10 @@ from .position import Position
 from .aircraft import Aircraft, AircraftState, AircraftType
 
 
+# States whose aircraft are never tracked as fuel emergencies
+_TERMINAL_STATES = frozenset({AircraftState.CRASHED, AircraftState.DEPARTED})
+
+
 class RunwayState(Enum):
     """
     States a runway can be in.
@@ -80,6 +85,22 @@ class Runway:
     width: float = 40.0
     state: RunwayState = RunwayState.AVAILABLE
     occupied_by: Optional[str] = None
+    unit_dx: float = field(init=False, repr=False, compare=False)
+    unit_dy: float = field(init=False, repr=False, compare=False)
+    takeoff_target: Position = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Precompute the takeoff direction, since runway geometry never changes."""
+        dx = self.end_position.x - self.start_position.x
+        dy = self.end_position.y - self.start_position.y
+        length = math.hypot(dx, dy)
+        self.unit_dx = dx / length
+        self.unit_dy = dy / length
+        # Departing aircraft climb out 500px past the runway end (off the screen)
+        self.takeoff_target = Position(
+            self.end_position.x + self.unit_dx * 500,
+            self.end_position.y + self.unit_dy * 500
+        )
     
     @property
     def is_available(self) -> bool:
@@ -231,6 +252,17 @@ class Airport:
         
         # Initialize aircraft list
         self.aircraft: List[Aircraft] = []
+        
+        # Active aircraft by fuel emergency level (id -> aircraft), kept current
+        # as fuel changes so fuel monitoring only visits aircraft that need it.
+        # low_fuel_aircraft excludes aircraft already in critical_fuel_aircraft.
+        self.critical_fuel_aircraft: Dict[str, Aircraft] = {}
+        self.low_fuel_aircraft: Dict[str, Aircraft] = {}
+        
+        # Aircraft bucketed by state (id -> aircraft). State changes of aircraft
+        # already in the airport must go through set_aircraft_state() so the
+        # buckets stay in step and per-state scans can skip everything else.
+        self.by_state: Dict[AircraftState, Dict[str, Aircraft]] = {state: {} for state in AircraftState}
     
     def _initialize_runways(self) -> None:
         """Initialize runways based on configuration settings."""
@@ -292,6 +324,24 @@ class Airport:
                 return gate
         return None
     
+    def get_available_runways(self) -> List[Runway]:
+        """
+        Get every available runway.
+        
+        Returns:
+            List[Runway]: Available runways, in runway order
+        """
+        return [runway for runway in self.runways if runway.is_available]
+    
+    def get_available_gates(self) -> List[Gate]:
+        """
+        Get every available gate.
+        
+        Returns:
+            List[Gate]: Available gates, in gate order
+        """
+        return [gate for gate in self.gates if gate.is_available]
+    
     def get_runway_by_id(self, runway_id: int) -> Optional[Runway]:
         """
         Get a runway by its ID.
@@ -330,6 +380,8 @@ class Airport:
             aircraft (Aircraft): The aircraft to add to the simulation
         """
         self.aircraft.append(aircraft)
+        self.by_state[aircraft.state][aircraft.id] = aircraft
+        self.refresh_fuel_state(aircraft)
     
     def remove_aircraft(self, aircraft: Aircraft) -> None:
         """
@@ -340,6 +392,65 @@ class Airport:
         """
         if aircraft in self.aircraft:
             self.aircraft.remove(aircraft)
+        self.by_state[aircraft.state].pop(aircraft.id, None)
+        self.critical_fuel_aircraft.pop(aircraft.id, None)
+        self.low_fuel_aircraft.pop(aircraft.id, None)
+    
+    def clear_aircraft(self) -> None:
+        """Remove every aircraft from the airport, including all tracking indexes."""
+        self.aircraft.clear()
+        for bucket in self.by_state.values():
+            bucket.clear()
+        self.critical_fuel_aircraft.clear()
+        self.low_fuel_aircraft.clear()
+    
+    def set_aircraft_state(self, aircraft: Aircraft, state: AircraftState) -> None:
+        """
+        Change an aircraft's state, moving it to the matching state bucket.
+        
+        Crashed and departed aircraft are also dropped from the fuel emergency
+        tracking, so the counts are correct immediately.
+        
+        Args:
+            aircraft (Aircraft): The aircraft whose state changes
+            state (AircraftState): The new state
+        """
+        # Only aircraft already added to the airport are bucketed
+        if self.by_state[aircraft.state].pop(aircraft.id, None) is not None:
+            self.by_state[state][aircraft.id] = aircraft
+        aircraft.state = state
+        
+        if state in _TERMINAL_STATES:
+            self.critical_fuel_aircraft.pop(aircraft.id, None)
+            self.low_fuel_aircraft.pop(aircraft.id, None)
+    
+    def refresh_fuel_state(self, aircraft: Aircraft) -> None:
+        """
+        Re-check an aircraft's fuel emergency level after its fuel or state changed.
+        
+        Crashed and departed aircraft are never tracked.
+        
+        Args:
+            aircraft (Aircraft): The aircraft whose fuel level may have changed
+        """
+        aircraft_id = aircraft.id
+        if aircraft.state in _TERMINAL_STATES:
+            self.critical_fuel_aircraft.pop(aircraft_id, None)
+            self.low_fuel_aircraft.pop(aircraft_id, None)
+        elif aircraft.is_critical_fuel():
+            self.critical_fuel_aircraft[aircraft_id] = aircraft
+            self.low_fuel_aircraft.pop(aircraft_id, None)
+        elif aircraft.is_low_fuel():
+            self.low_fuel_aircraft[aircraft_id] = aircraft
+            self.critical_fuel_aircraft.pop(aircraft_id, None)
+        else:
+            self.critical_fuel_aircraft.pop(aircraft_id, None)
+            self.low_fuel_aircraft.pop(aircraft_id, None)
+    
+    @property
+    def low_fuel_count(self) -> int:
+        """Number of active aircraft below the low fuel threshold (including critical)."""
+        return len(self.critical_fuel_aircraft) + len(self.low_fuel_aircraft)
     
     def spawn_aircraft(self, is_arrival: bool = True) -> Aircraft:
         """
@@ -464,9 +575,10 @@ class Airport:
         """
         self.current_time += dt
         
-        # Update all aircraft
+        # Update all aircraft; fuel tracking only changes when a threshold is crossed
         for aircraft in self.aircraft:
-            aircraft.update(dt)
+            if aircraft.update(dt):
+                self.refresh_fuel_state(aircraft)
     
     def get_aircraft(self, aircraft_id: str) -> Optional['Aircraft']:
         """
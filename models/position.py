@@ -22,6 +22,9 @@ class Position:
         x (float): X coordinate in pixels
         y (float): Y coordinate in pixels
     """
+    # Positions are created every frame; slots skip the per-instance __dict__
+    __slots__ = ('x', 'y')
+
     x: float
     y: float
 
@@ -35,7 +38,24 @@ class Position:
         Returns:
             float: Distance in pixels between the two positions
         """
-        return math.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
+        return math.hypot(self.x - other.x, self.y - other.y)
+
+    def distance_sq_to(self, other: 'Position') -> float:
+        """
+        Calculate the squared Euclidean distance to another position.
+        
+        Cheaper than distance_to() because it skips the square root; use it
+        when comparing against a threshold that has been squared as well.
+        
+        Args:
+            other (Position): The target position to measure distance to
+            
+        Returns:
+            float: Squared distance in pixels between the two positions
+        """
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
 
     def move_towards(self, target: 'Position', speed: float, dt: float) -> 'Position':
         """
@@ -58,7 +78,7 @@ class Position:
         dy = target.y - self.y
         
         # Calculate the distance to target
-        distance = math.sqrt(dx ** 2 + dy ** 2)
+        distance = math.hypot(dx, dy)
         
         # If we're already at the target or very close, return the target
         if distance <= 0.1:
@@ -449,7 +449,6 @@ class SimulationEngine:
         """Process aircraft in holding patterns waiting for runway assignments."""
         holding_aircraft = [a for a in self.airport.aircraft 
                            if a.state == AircraftState.HOLDING and 
-                           hasattr(a, 'waiting_for_runway') and 
                            a.waiting_for_runway]
         
         for aircraft in holding_aircraft:
@@ -538,7 +537,7 @@ class SimulationEngine:
                     else:
                         # No runway available - move to holding area
                         # Only move to holding if not already attempted
-                        if not hasattr(aircraft, 'waiting_for_runway'):
+                        if not aircraft.waiting_for_runway:
                             aircraft.waiting_for_runway = True
                             center_x = self.airport.config.airport.airport_width / 2
                             center_y = self.airport.config.airport.airport_height / 2
@@ -15,6 +15,7 @@ from typing import Dict, List, Tuple, Optional
 from models.aircraft import Aircraft, AircraftState
 from models.airport import Airport
 from models.position import Position
+from utils.math_utils import distance_sq, pairs_within, positions_to_xy
 
 
 class CollisionSystem:
@@ -74,70 +75,73 @@ class CollisionSystem:
         collision_pairs = []
         emergency_groups = []
         
-        # Check all aircraft pairs
-        for i in range(len(aircraft_list)):
-            for j in range(i + 1, len(aircraft_list)):
-                aircraft1 = aircraft_list[i]
-                aircraft2 = aircraft_list[j]
-                
-                distance = aircraft1.distance_to(aircraft2)
+        # Only pairs inside the widest (AI warning) radius can trigger any
+        # avoidance layer, so let the batch query skip everything farther out
+        warning_distance = 500.0
+        xy = positions_to_xy(a.position for a in aircraft_list)
+        for i, j in pairs_within(xy, warning_distance).tolist():
+            aircraft1 = aircraft_list[i]
+            aircraft2 = aircraft_list[j]
+            
+            # Squared distance; thresholds below are squared to skip the sqrt
+            dist_sq = distance_sq(aircraft1.position, aircraft2.position)
+            
+            # IMMEDIATE EMERGENCY AVOIDANCE - if very close, don't wait for AI
+            if dist_sq <= 100.0 * 100.0:
+                # Check if either aircraft is already in emergency separation
+                key1 = aircraft1.id
+                key2 = aircraft2.id
+                current_time = self.airport.current_time
                 
-                # IMMEDIATE EMERGENCY AVOIDANCE - if very close, don't wait for AI
-                if distance <= 100.0:
-                    # Check if either aircraft is already in emergency separation
-                    key1 = aircraft1.id
-                    key2 = aircraft2.id
-                    current_time = self.airport.current_time
+                if (key1 not in self.emergency_separation_active and 
+                    key2 not in self.emergency_separation_active):
                     
-                    if (key1 not in self.emergency_separation_active and 
-                        key2 not in self.emergency_separation_active):
-                        
-                        print(f"🚨 EMERGENCY COLLISION AVOIDANCE: {aircraft1.callsign} and {aircraft2.callsign} only {distance:.0f}px apart!")
-                        
-                        # Mark both aircraft as in emergency separation
-                        self.emergency_separation_active[key1] = current_time
-                        self.emergency_separation_active[key2] = current_time
-                        
-                        # Execute immediate avoidance for both aircraft
-                        self.execute_emergency_avoidance(aircraft1, aircraft2)
-                        continue  # Skip normal collision avoidance for this pair
-                
-                # SMART AVOIDANCE LAYER - medium range with predictive positioning
-                elif distance <= 200.0:
-                    pair_key = f"{min(aircraft1.id, aircraft2.id)}_{max(aircraft1.id, aircraft2.id)}"
-                    current_time = self.airport.current_time
+                    print(f"🚨 EMERGENCY COLLISION AVOIDANCE: {aircraft1.callsign} and {aircraft2.callsign} only {math.sqrt(dist_sq):.0f}px apart!")
                     
-                    if (pair_key not in self.collision_avoidance_last_triggered or 
-                        current_time - self.collision_avoidance_last_triggered[pair_key] >= self.collision_avoidance_interval):
-                        
-                        # Use smart positioning to avoid cascade collisions
-                        avoid_aircraft = self._select_avoidance_aircraft(aircraft1, aircraft2)
-                        safe_position = self._find_safe_avoidance_position(avoid_aircraft, aircraft_list)
-                        
-                        if safe_position:
-                            self.collision_avoidance_last_triggered[pair_key] = current_time
-                            self._execute_smart_avoidance(avoid_aircraft, safe_position)
-                            print(f"🔄 SMART AVOIDANCE: {avoid_aircraft.callsign} moving to safe position")
-                            continue
+                    # Mark both aircraft as in emergency separation
+                    self.emergency_separation_active[key1] = current_time
+                    self.emergency_separation_active[key2] = current_time
+                    
+                    # Execute immediate avoidance for both aircraft
+                    self.execute_emergency_avoidance(aircraft1, aircraft2)
+                    continue  # Skip normal collision avoidance for this pair
+            
+            # SMART AVOIDANCE LAYER - medium range with predictive positioning
+            elif dist_sq <= 200.0 * 200.0:
+                pair_key = f"{min(aircraft1.id, aircraft2.id)}_{max(aircraft1.id, aircraft2.id)}"
+                current_time = self.airport.current_time
                 
-                # Normal AI collision avoidance for longer distances (500px instead of 400px)
-                if aircraft1.is_collision_imminent(aircraft2, warning_distance=500.0):
-                    # Check throttling to avoid repeated avoidance for same pair
-                    pair_key = f"{min(aircraft1.id, aircraft2.id)}_{max(aircraft1.id, aircraft2.id)}"
-                    current_time = self.airport.current_time
+                if (pair_key not in self.collision_avoidance_last_triggered or 
+                    current_time - self.collision_avoidance_last_triggered[pair_key] >= self.collision_avoidance_interval):
                     
-                    if (pair_key not in self.collision_avoidance_last_triggered or 
-                        current_time - self.collision_avoidance_last_triggered[pair_key] >= self.collision_avoidance_interval):
-                        
-                        # Update throttling timestamp
+                    # Use smart positioning to avoid cascade collisions
+                    avoid_aircraft = self._select_avoidance_aircraft(aircraft1, aircraft2)
+                    safe_position = self._find_safe_avoidance_position(avoid_aircraft, aircraft_list)
+                    
+                    if safe_position:
                         self.collision_avoidance_last_triggered[pair_key] = current_time
-                        
-                        # Determine which aircraft should avoid
-                        avoid_aircraft = self._select_avoidance_aircraft(aircraft1, aircraft2)
-                        conflicting_aircraft = aircraft1 if avoid_aircraft == aircraft2 else aircraft2
-                        
-                        collision_pairs.append((avoid_aircraft, conflicting_aircraft))
-        
+                        self._execute_smart_avoidance(avoid_aircraft, safe_position)
+                        print(f"🔄 SMART AVOIDANCE: {avoid_aircraft.callsign} moving to safe position")
+                        continue
+            
+            # Normal AI collision avoidance for longer distances (500px instead of 400px)
+            if aircraft1.is_collision_imminent(aircraft2, warning_distance=warning_distance):
+                # Check throttling to avoid repeated avoidance for same pair
+                pair_key = f"{min(aircraft1.id, aircraft2.id)}_{max(aircraft1.id, aircraft2.id)}"
+                current_time = self.airport.current_time
+                
+                if (pair_key not in self.collision_avoidance_last_triggered or 
+                    current_time - self.collision_avoidance_last_triggered[pair_key] >= self.collision_avoidance_interval):
+                    
+                    # Update throttling timestamp
+                    self.collision_avoidance_last_triggered[pair_key] = current_time
+                    
+                    # Determine which aircraft should avoid
+                    avoid_aircraft = self._select_avoidance_aircraft(aircraft1, aircraft2)
+                    conflicting_aircraft = aircraft1 if avoid_aircraft == aircraft2 else aircraft2
+                    
+                    collision_pairs.append((avoid_aircraft, conflicting_aircraft))
+    
         # Clean up expired emergency separation entries
         current_time = self.airport.current_time
         expired_keys = [k for k, v in self.emergency_separation_active.items() 
@@ -200,17 +204,19 @@ class CollisionSystem:
         Returns:
             bool: True if position is safe
         """
+        min_distance_sq = min_distance * min_distance
+        
         for other_aircraft in all_aircraft:
             if (other_aircraft != exclude_aircraft and 
                 other_aircraft.state not in [AircraftState.CRASHED, AircraftState.DEPARTED]):
                 
                 # Check distance to aircraft current position
-                if position.distance_to(other_aircraft.position) < min_distance:
+                if distance_sq(position, other_aircraft.position) < min_distance_sq:
                     return False
                 
                 # Check distance to aircraft target position (predictive)
                 if hasattr(other_aircraft, 'target_position'):
-                    if position.distance_to(other_aircraft.target_position) < min_distance:
+                    if distance_sq(position, other_aircraft.target_position) < min_distance_sq:
                         return False
         
         return True
@@ -230,24 +236,25 @@ class CollisionSystem:
         center_y = self.airport.config.airport.airport_height / 2
         
         best_position = Position(center_x, center_y)
-        best_min_distance = 0
+        # Separations are compared squared; the ordering is the same
+        best_min_distance_sq = 0
         
         # Sample positions in a grid pattern
         for x in range(100, self.airport.config.airport.airport_width - 100, 100):
             for y in range(100, self.airport.config.airport.airport_height - 100, 100):
                 candidate_pos = Position(x, y)
                 
-                # Find minimum distance to any other aircraft
-                min_distance = float('inf')
+                # Find minimum squared distance to any other aircraft
+                min_distance_sq = float('inf')
                 for other_aircraft in all_aircraft:
                     if (other_aircraft != aircraft and 
                         other_aircraft.state not in [AircraftState.CRASHED, AircraftState.DEPARTED]):
-                        distance = candidate_pos.distance_to(other_aircraft.position)
-                        min_distance = min(min_distance, distance)
+                        min_distance_sq = min(min_distance_sq,
+                                              distance_sq(candidate_pos, other_aircraft.position))
                 
                 # Update best position if this one has better separation
-                if min_distance > best_min_distance:
-                    best_min_distance = min_distance
+                if min_distance_sq > best_min_distance_sq:
+                    best_min_distance_sq = min_distance_sq
                     best_position = candidate_pos
         
         return best_position
@@ -261,7 +268,7 @@ class CollisionSystem:
             safe_position: Pre-calculated safe position
         """
         aircraft.target_position = safe_position
-        aircraft.state = AircraftState.HOLDING
+        self.airport.set_aircraft_state(aircraft, AircraftState.HOLDING)
         
         print(f"SMART AVOIDANCE: {aircraft.callsign} → ({safe_position.x:.0f},{safe_position.y:.0f})")
     
@@ -345,8 +352,8 @@ class CollisionSystem:
             aircraft2.target_position = pos2
             
             # Set both to holding state
-            aircraft1.state = AircraftState.HOLDING
-            aircraft2.state = AircraftState.HOLDING
+            self.airport.set_aircraft_state(aircraft1, AircraftState.HOLDING)
+            self.airport.set_aircraft_state(aircraft2, AircraftState.HOLDING)
             
             print(f"EMERGENCY SEPARATION: {aircraft1.callsign} → ({pos1.x:.0f},{pos1.y:.0f}), {aircraft2.callsign} → ({pos2.x:.0f},{pos2.y:.0f})")
     
@@ -366,7 +373,7 @@ class CollisionSystem:
         
         if safe_position:
             aircraft.target_position = safe_position
-            aircraft.state = AircraftState.HOLDING
+            self.airport.set_aircraft_state(aircraft, AircraftState.HOLDING)
             print(f"COLLISION AVOIDANCE: {aircraft.callsign} moving to safe position ({safe_position.x:.0f},{safe_position.y:.0f})")
         else:
             # Fallback to original method if no safe position found
@@ -388,7 +395,7 @@ class CollisionSystem:
             avoid_y = max(margin, min(self.airport.config.airport.airport_height - margin, avoid_y))
             
             aircraft.target_position = Position(avoid_x, avoid_y)
-            aircraft.state = AircraftState.HOLDING
+            self.airport.set_aircraft_state(aircraft, AircraftState.HOLDING)
             
             print(f"COLLISION AVOIDANCE: {aircraft.callsign} moving to fallback position {avoidance_position}")
     
@@ -423,8 +430,8 @@ class CollisionSystem:
         """
         for aircraft1, aircraft2 in collisions:
             # Both aircraft crash
-            aircraft1.state = AircraftState.CRASHED
-            aircraft2.state = AircraftState.CRASHED
+            self.airport.set_aircraft_state(aircraft1, AircraftState.CRASHED)
+            self.airport.set_aircraft_state(aircraft2, AircraftState.CRASHED)
             aircraft1.crash_reason = "MID-AIR COLLISION"
             aircraft2.crash_reason = "MID-AIR COLLISION"
             
@@ -11,7 +11,7 @@ from typing import Dict, List, Optional
 
 from config import get_config
 from models.aircraft import Aircraft, AircraftState
-from models.airport import Airport
+from models.airport import Airport, RunwayState
 from models.position import Position
 from ai_interface import AIManager
 
@@ -141,21 +141,21 @@ class SimulationEngine:
             runway = self.airport.runways[target]
             aircraft.assigned_runway = target
             aircraft.target_position = runway.center_position
-            aircraft.state = AircraftState.LANDING
+            self.airport.set_aircraft_state(aircraft, AircraftState.LANDING)
             runway.state = runway.state  # Keep current state for now
             
         elif action == 'assign_gate' and target is not None:
             gate = self.airport.gates[target]
             aircraft.assigned_gate = target
             aircraft.target_position = gate.position
-            aircraft.state = AircraftState.TAXIING_TO_GATE
+            self.airport.set_aircraft_state(aircraft, AircraftState.TAXIING_TO_GATE)
             gate.occupied_by = aircraft.id
             
         elif action == 'assign_takeoff' and target is not None:
             runway = self.airport.runways[target]
             aircraft.assigned_runway = target
             aircraft.target_position = runway.center_position
-            aircraft.state = AircraftState.TAXIING_TO_RUNWAY
+            self.airport.set_aircraft_state(aircraft, AircraftState.TAXIING_TO_RUNWAY)
             
         elif action == 'hold_pattern':
             # Check if aircraft can safely enter holding pattern
@@ -169,7 +169,7 @@ class SimulationEngine:
                     center_x + math.cos(angle) * hold_radius,
                     center_y + math.sin(angle) * hold_radius
                 )
-                aircraft.state = AircraftState.HOLDING
+                self.airport.set_aircraft_state(aircraft, AircraftState.HOLDING)
                 safe_time = aircraft.get_safe_holding_time()
                 print(f"HOLD PATTERN: {aircraft.callsign} entering holding (fuel: {aircraft.fuel:.1f}%, safe for {safe_time:.1f} minutes)")
             else:
@@ -192,12 +192,12 @@ class SimulationEngine:
                                     center_x + math.cos(angle) * hold_radius,
                                     center_y + math.sin(angle) * hold_radius
                                 )
-                                current_occupant.state = AircraftState.HOLDING
+                                self.airport.set_aircraft_state(current_occupant, AircraftState.HOLDING)
                                 current_occupant.assigned_runway = None
                 
                 aircraft.assigned_runway = runway.id
                 aircraft.target_position = runway.center_position
-                aircraft.state = AircraftState.LANDING
+                self.airport.set_aircraft_state(aircraft, AircraftState.LANDING)
                 runway.state = RunwayState.OCCUPIED_LANDING
                 runway.occupied_by = aircraft.id
                 print(f"FUEL EMERGENCY: {aircraft.callsign} cannot hold (fuel: {aircraft.fuel:.1f}%) - forced immediate landing on runway {runway.id}")
@@ -305,14 +305,10 @@ class SimulationEngine:
             
             self.last_ai_decision = self.airport.current_time
         
-        # Check for landed aircraft waiting for gates
-        self.state_manager.assign_gates_to_waiting_aircraft()
-        
-        # Handle aircraft departures
-        self.state_manager.schedule_departures()
-        
-        # Handle aircraft in holding patterns waiting for runways
-        self.state_manager.process_holding_aircraft()
+        # Gate assignments, departures and holding clearances. Runs after fuel
+        # emergency handling so critical fuel arrivals get first claim on free
+        # runways.
+        self.state_manager.tick(dt)
     
     def handle_crashes(self):
         """Handle crashed aircraft and update crash statistics."""
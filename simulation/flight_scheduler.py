@@ -6,13 +6,14 @@ and manages the timing and distribution of airport traffic with advanced
 traffic flow management to prevent collision scenarios.
 """
 
+import heapq
 import math
 import random
-from typing import List
+from typing import List, Optional, Tuple
 
 from config import get_config
 from models.aircraft import Aircraft, AircraftType, AircraftState
-from models.airport import Airport, Flight
+from models.airport import Airport, Flight, Gate
 from models.position import Position
 
 
@@ -28,6 +29,18 @@ class FlightScheduler:
     - Traffic flow management to prevent collision scenarios
     """
     
+    # Perimeter sample points used by the emergency spawn fallback
+    _EMERGENCY_ANGLES = tuple(i * math.pi / 4 for i in range(8))
+    _EMERGENCY_DISTANCES = (400, 500, 600)
+    
+    # How far ahead (seconds) spawn conflict prediction looks; at approach
+    # speed this covers roughly the distance from the spawn ring to the airport
+    _CPA_LOOKAHEAD = 3.0
+    
+    # Spawn sectors around the airport
+    _SPAWN_SECTORS = 8
+    _SECTOR_ANGLE = 2 * math.pi / _SPAWN_SECTORS
+    
     def __init__(self, airport: Airport):
         """
         Initialize the flight scheduler.
@@ -36,12 +49,26 @@ class FlightScheduler:
             airport (Airport): The airport instance to schedule flights for
         """
         self.airport = airport
+        
+        # Airport geometry is fixed for the run, so resolve it once
+        airport_config = airport.config.airport
+        self._airport_width = airport_config.airport_width
+        self._airport_height = airport_config.airport_height
+        self._center_x = self._airport_width / 2
+        self._center_y = self._airport_height / 2
+        self._center = Position(self._center_x, self._center_y)
+        
         self.scheduled_flights: List[Flight] = []
         self.last_spawn_time = 0
         
+        # Pending scheduler events as (due_time, event_name), ordered by due time
+        self._events: List[Tuple[float, str]] = []
+        
         # Traffic flow management
         self.last_spawn_sectors: List[int] = []  # Track last spawn sectors to avoid clustering
         self.min_spawn_separation = 300.0  # Minimum distance between new spawns and existing aircraft
+        self._spawn_separation_sq = self.min_spawn_separation ** 2
+        self._predicted_separation_sq = (self.min_spawn_separation * 0.7) ** 2
         self.spawn_attempt_limit = 10  # Maximum attempts to find safe spawn position
         
         # Airport codes for realistic flight generation
@@ -49,6 +76,21 @@ class FlightScheduler:
         self.destinations = ["ATL", "BOS", "LAS", "PHX", "IAH", "CLT", "MSP", "DTW"]
         self.aircraft_types = ["Boeing 737", "Airbus A320", "Boeing 777", "Airbus A380"]
         
+        # Schedule the first spawn
+        self.reset()
+    
+    def reset(self):
+        """
+        Drop pending spawn events and spawn history, and schedule a fresh first spawn.
+        
+        Call this whenever the simulation is reset, so due times from the old
+        run neither fire a burst of spawns nor hold spawning back.
+        """
+        self._events.clear()
+        self.last_spawn_sectors.clear()
+        self.last_spawn_time = self.airport.current_time
+        heapq.heappush(self._events, (self.airport.current_time + self._get_spawn_interval([]), 'spawn'))
+        
     def generate_flight(self, flight_type: str = "arrival") -> Flight:
         """
         Generate a new flight with realistic details.
@@ -68,12 +110,17 @@ class FlightScheduler:
         )
         return flight
     
-    def spawn_aircraft(self, flight: Flight) -> Aircraft:
+    def spawn_aircraft(self, flight: Flight, existing_aircraft: Optional[List[Aircraft]] = None,
+                       gate: Optional[Gate] = None) -> Aircraft:
         """
         Spawn an aircraft for a given flight with appropriate positioning and state.
         
         Args:
             flight (Flight): The flight to create an aircraft for
+            existing_aircraft (Optional[List[Aircraft]]): Active aircraft to keep
+                separation from (computed from the airport if None)
+            gate (Optional[Gate]): Gate already chosen for a departure
+                (looked up if None)
             
         Returns:
             Aircraft: The spawned aircraft ready for simulation
@@ -87,38 +134,42 @@ class FlightScheduler:
         )
         
         if flight.flight_type == "arrival":
-            aircraft = self._spawn_arrival_aircraft_safe(aircraft)
+            aircraft = self._spawn_arrival_aircraft_safe(aircraft, existing_aircraft)
         else:
-            aircraft = self._spawn_departure_aircraft(aircraft)
+            aircraft = self._spawn_departure_aircraft(aircraft, gate)
             
         return aircraft
     
-    def _spawn_arrival_aircraft_safe(self, aircraft: Aircraft) -> Aircraft:
+    def _spawn_arrival_aircraft_safe(self, aircraft: Aircraft,
+                                     existing_aircraft: Optional[List[Aircraft]] = None) -> Aircraft:
         """
         Configure aircraft for arrival with safe positioning to prevent clustering.
         
         Args:
             aircraft (Aircraft): The aircraft to configure
+            existing_aircraft (Optional[List[Aircraft]]): Active aircraft to keep
+                separation from (computed from the airport if None)
             
         Returns:
             Aircraft: The configured arrival aircraft
         """
         # Get list of existing aircraft for conflict checking
-        existing_aircraft = [a for a in self.airport.aircraft 
-                           if a.state not in [AircraftState.CRASHED, AircraftState.DEPARTED]]
+        if existing_aircraft is None:
+            existing_aircraft = [a for a in self.airport.aircraft 
+                               if a.state not in [AircraftState.CRASHED, AircraftState.DEPARTED]]
         
         # Try multiple spawn attempts to find safe position
         for attempt in range(self.spawn_attempt_limit):
             # Use sector-based spawning to distribute aircraft evenly
-            spawn_position = self._get_safe_spawn_position(existing_aircraft, attempt)
+            spawn_position = self._get_safe_spawn_position(existing_aircraft, attempt, aircraft.speed)
             
             if spawn_position:
                 aircraft.position = spawn_position
                 aircraft.state = AircraftState.APPROACHING
                 
                 # Set target to airport center with some randomization
-                center_x = self.airport.config.airport.airport_width / 2
-                center_y = self.airport.config.airport.airport_height / 2
+                center_x = self._center_x
+                center_y = self._center_y
                 
                 # Add slight offset to target to spread approach patterns
                 target_offset_x = random.randint(-50, 50)
@@ -140,23 +191,21 @@ class FlightScheduler:
         print(f"WARNING: Emergency spawn for {aircraft.callsign} - no safe position found")
         return self._emergency_spawn_arrival(aircraft)
     
-    def _get_safe_spawn_position(self, existing_aircraft: List[Aircraft], attempt: int) -> Position:
+    def _get_safe_spawn_position(self, existing_aircraft: List[Aircraft], attempt: int,
+                                 speed: float = 150.0) -> Position:
         """
         Get a safe spawn position that maintains separation from existing aircraft.
         
         Args:
             existing_aircraft: List of existing aircraft to avoid
             attempt: Current spawn attempt number
+            speed: Speed of the aircraft being spawned, used to predict conflicts
             
         Returns:
             Position: Safe spawn position or None if no safe position found
         """
-        center_x = self.airport.config.airport.airport_width / 2
-        center_y = self.airport.config.airport.airport_height / 2
-        
-        # Define spawn sectors around the airport (8 sectors)
-        total_sectors = 8
-        sector_angle = 2 * math.pi / total_sectors
+        total_sectors = self._SPAWN_SECTORS
+        sector_angle = self._SECTOR_ANGLE
         
         # Choose sector based on attempt and recent spawn history
         available_sectors = list(range(total_sectors))
@@ -188,18 +237,21 @@ class FlightScheduler:
         distance_variation = random.uniform(-50, 100) + (attempt * 20)  # Increase distance on later attempts
         spawn_distance = base_distance + distance_variation
         
-        spawn_x = center_x + math.cos(spawn_angle) * spawn_distance
-        spawn_y = center_y + math.sin(spawn_angle) * spawn_distance
+        spawn_x = self._center_x + math.cos(spawn_angle) * spawn_distance
+        spawn_y = self._center_y + math.sin(spawn_angle) * spawn_distance
         
         # Clamp to screen bounds
         margin = 50
-        spawn_x = max(margin, min(self.airport.config.airport.airport_width - margin, spawn_x))
-        spawn_y = max(margin, min(self.airport.config.airport.airport_height - margin, spawn_y))
+        spawn_x = max(margin, min(self._airport_width - margin, spawn_x))
+        spawn_y = max(margin, min(self._airport_height - margin, spawn_y))
         
         spawn_position = Position(spawn_x, spawn_y)
         
+        # New arrivals head for the airport center
+        spawn_velocity = self._velocity_towards(spawn_position, self._center, speed)
+        
         # Check if position is safe from existing aircraft
-        if self._is_spawn_position_safe(spawn_position, existing_aircraft):
+        if self._is_spawn_position_safe(spawn_position, existing_aircraft, spawn_velocity):
             # Update spawn sector history
             self.last_spawn_sectors.append(sector)
             if len(self.last_spawn_sectors) > 5:  # Keep history of last 5 spawns
@@ -209,29 +261,86 @@ class FlightScheduler:
         
         return None
     
-    def _is_spawn_position_safe(self, position: Position, existing_aircraft: List[Aircraft]) -> bool:
+    def _is_spawn_position_safe(self, position: Position, existing_aircraft: List[Aircraft],
+                                velocity: Tuple[float, float] = (0.0, 0.0)) -> bool:
         """
         Check if spawn position is safe from existing aircraft.
         
+        The spawn must be at least min_spawn_separation from every aircraft now.
+        Closest point of approach (CPA) prediction then assumes each existing
+        aircraft flies straight at its target and rejects the spawn only if the
+        two would come within 70% of min_spawn_separation before that aircraft
+        reaches its target, looking at most _CPA_LOOKAHEAD seconds ahead. A
+        target position near the spawn therefore only matters if the aircraft
+        gets there within the window.
+        
         Args:
             position: Position to check
             existing_aircraft: List of existing aircraft
+            velocity: (vx, vy) of the aircraft being spawned in pixels per second
             
         Returns:
             bool: True if position is safe
         """
+        spawn_vx, spawn_vy = velocity
+        horizon = self._CPA_LOOKAHEAD
+        
         for aircraft in existing_aircraft:
             # Check distance to current position
-            if position.distance_to(aircraft.position) < self.min_spawn_separation:
+            dpx = position.x - aircraft.position.x
+            dpy = position.y - aircraft.position.y
+            if dpx * dpx + dpy * dpy < self._spawn_separation_sq:
                 return False
             
-            # Check distance to target position (where aircraft is heading)
-            if hasattr(aircraft, 'target_position'):
-                if position.distance_to(aircraft.target_position) < self.min_spawn_separation * 0.7:
-                    return False
+            # Relative velocity, assuming the aircraft keeps heading for its target
+            target = aircraft.target_position
+            other_vx, other_vy = self._velocity_towards(aircraft.position, target, aircraft.speed)
+            dvx = spawn_vx - other_vx
+            dvy = spawn_vy - other_vy
+            
+            # The straight-line prediction only holds until the aircraft reaches
+            # its target, so the window ends there or at the lookahead horizon
+            leg_time = aircraft.position.distance_to(target) / aircraft.speed if aircraft.speed > 0 else 0.0
+            window = min(horizon, leg_time)
+            
+            # Time of closest approach within the window
+            relative_speed_sq = dvx * dvx + dvy * dvy
+            if relative_speed_sq > 0:
+                t_cpa = -(dvx * dpx + dvy * dpy) / relative_speed_sq
+                t_cpa = max(0.0, min(window, t_cpa))
+            else:
+                t_cpa = 0.0
+            
+            # Predicted separation at closest approach
+            cpa_x = dpx + dvx * t_cpa
+            cpa_y = dpy + dvy * t_cpa
+            if cpa_x * cpa_x + cpa_y * cpa_y < self._predicted_separation_sq:
+                return False
         
         return True
     
+    def _velocity_towards(self, position: Position, target: Position, speed: float) -> Tuple[float, float]:
+        """
+        Estimate the velocity of an aircraft flying straight at its target.
+        
+        Args:
+            position: Current position
+            target: Position being flown towards
+            speed: Speed in pixels per second
+            
+        Returns:
+            Tuple[float, float]: (vx, vy), zero if already at the target
+        """
+        dx = target.x - position.x
+        dy = target.y - position.y
+        distance = math.hypot(dx, dy)
+        
+        # Aircraft.update() stops moving within 5 pixels of the target
+        if distance <= 5:
+            return 0.0, 0.0
+        
+        return dx / distance * speed, dy / distance * speed
+    
     def _emergency_spawn_arrival(self, aircraft: Aircraft) -> Aircraft:
         """
         Emergency spawn for arrival aircraft when no safe position is found.
@@ -243,36 +352,40 @@ class FlightScheduler:
             Aircraft: Configured aircraft with emergency spawn position
         """
         # Find the position with maximum distance from all other aircraft
-        center_x = self.airport.config.airport.airport_width / 2
-        center_y = self.airport.config.airport.airport_height / 2
+        center_x = self._center_x
+        center_y = self._center_y
         
-        best_position = Position(center_x + 400, center_y)  # Default far position
-        best_min_distance = 0
+        best_xy = (center_x + 400, center_y)  # Default far position
+        best_min_distance_sq = 0
+        
+        # Candidates stay as plain tuples; only the winner becomes a Position
+        active_positions = [a.position for a in self.airport.aircraft
+                            if a.state not in [AircraftState.CRASHED, AircraftState.DEPARTED]]
         
         # Sample positions around the perimeter
-        for angle in [0, math.pi/4, math.pi/2, 3*math.pi/4, math.pi, 5*math.pi/4, 3*math.pi/2, 7*math.pi/4]:
-            for distance in [400, 500, 600]:
+        for angle in self._EMERGENCY_ANGLES:
+            for distance in self._EMERGENCY_DISTANCES:
                 x = center_x + math.cos(angle) * distance
                 y = center_y + math.sin(angle) * distance
                 
                 # Clamp to bounds
                 margin = 30
-                x = max(margin, min(self.airport.config.airport.airport_width - margin, x))
-                y = max(margin, min(self.airport.config.airport.airport_height - margin, y))
-                
-                candidate_pos = Position(x, y)
+                x = max(margin, min(self._airport_width - margin, x))
+                y = max(margin, min(self._airport_height - margin, y))
                 
-                # Find minimum distance to any existing aircraft
-                min_distance = float('inf')
-                for other_aircraft in self.airport.aircraft:
-                    if other_aircraft.state not in [AircraftState.CRASHED, AircraftState.DEPARTED]:
-                        dist = candidate_pos.distance_to(other_aircraft.position)
-                        min_distance = min(min_distance, dist)
+                # Find minimum (squared) distance to any existing aircraft
+                min_distance_sq = float('inf')
+                for other_position in active_positions:
+                    dx = x - other_position.x
+                    dy = y - other_position.y
+                    min_distance_sq = min(min_distance_sq, dx * dx + dy * dy)
                 
                 # Update best position if this has better separation
-                if min_distance > best_min_distance:
-                    best_min_distance = min_distance
-                    best_position = candidate_pos
+                if min_distance_sq > best_min_distance_sq:
+                    best_min_distance_sq = min_distance_sq
+                    best_xy = (x, y)
+        
+        best_position = Position(*best_xy)
         
         aircraft.position = best_position
         aircraft.state = AircraftState.APPROACHING
@@ -281,17 +394,20 @@ class FlightScheduler:
         
         return aircraft
     
-    def _spawn_departure_aircraft(self, aircraft: Aircraft) -> Aircraft:
+    def _spawn_departure_aircraft(self, aircraft: Aircraft, gate: Optional[Gate] = None) -> Aircraft:
         """
         Configure aircraft for departure by placing at an available gate.
         
         Args:
             aircraft (Aircraft): The aircraft to configure
+            gate (Optional[Gate]): Gate to place the aircraft at (first
+                available gate if None)
             
         Returns:
             Aircraft: The configured departure aircraft
         """
-        gate = self.airport.get_available_gate()
+        if gate is None:
+            gate = self.airport.get_available_gate()
         if gate:
             aircraft.position = Position(gate.position.x, gate.position.y)
             aircraft.assigned_gate = gate.id
@@ -307,28 +423,21 @@ class FlightScheduler:
         
         return aircraft
     
-    def update(self, dt: float):
+    def _get_spawn_interval(self, active_aircraft: List[Aircraft]) -> float:
         """
-        Update flight scheduling and spawn new aircraft as needed.
-        
-        This method manages the timing of new aircraft spawns based on:
-        - Dynamic spawn rate configuration
-        - Current airport capacity
-        - Traffic balance (70% arrivals, 30% departures)
-        - Traffic flow management to prevent clustering
+        Calculate the time between spawns for the current traffic level.
         
         Args:
-            dt (float): Time step in seconds since last update
+            active_aircraft: Aircraft currently active in the airspace
+            
+        Returns:
+            float: Seconds between spawns
         """
         config = get_config()
         
         # Get spawn rate from configuration
         dynamic_spawn_rate = getattr(config.simulation, 'spawn_rate', 1.0) if hasattr(config, 'simulation') else 1.0
         
-        # Adjust spawn rate based on current traffic density to prevent overcrowding
-        active_aircraft = [a for a in self.airport.aircraft 
-                         if a.state not in [AircraftState.CRASHED, AircraftState.DEPARTED]]
-        
         # Reduce spawn rate if airspace is crowded
         airspace_density = len(active_aircraft) / 20.0  # Normalize to typical max aircraft
         if airspace_density > 0.7:  # If more than 70% full
@@ -337,25 +446,85 @@ class FlightScheduler:
         elif airspace_density > 0.5:  # If more than 50% full
             dynamic_spawn_rate *= 0.75  # Reduce spawn rate by 25%
         
-        spawn_interval = 1.0 / dynamic_spawn_rate
+        return 1.0 / dynamic_spawn_rate
+    
+    def update(self, dt: float):
+        """
+        Update flight scheduling and spawn new aircraft as needed.
         
-        # Check if it's time to spawn a new aircraft
-        if (self.airport.current_time - self.last_spawn_time) > spawn_interval:
-            max_aircraft = getattr(config.simulation, 'max_aircraft', 20) if hasattr(config, 'simulation') else 20
+        Spawns are driven by a heap of scheduled events, so frames where
+        nothing is due return immediately. This method manages the timing
+        of new aircraft spawns based on:
+        - Dynamic spawn rate configuration
+        - Current airport capacity
+        - Traffic balance (70% arrivals, 30% departures)
+        - Traffic flow management to prevent clustering
+        
+        Args:
+            dt (float): Time step in seconds since last update
+        """
+        current_time = self.airport.current_time
+        if not self._events or self._events[0][0] > current_time:
+            return
+        
+        config = get_config()
+        max_aircraft = getattr(config.simulation, 'max_aircraft', 20) if hasattr(config, 'simulation') else 20
+        
+        # Built once and shared by every spawn due this tick (more than one when
+        # the frame time was long or the simulation is running fast-forward)
+        active_aircraft = [a for a in self.airport.aircraft 
+                         if a.state not in [AircraftState.CRASHED, AircraftState.DEPARTED]]
+        
+        while self._events and self._events[0][0] <= current_time:
+            due_time, event = heapq.heappop(self._events)
             
-            if len(self.airport.aircraft) < max_aircraft:
-                # Balance traffic: 70% arrivals, 30% departures
-                flight_type = "arrival" if random.random() < 0.7 else "departure"
-                
-                # Generate and spawn the aircraft
-                flight = self.generate_flight(flight_type)
-                aircraft = self.spawn_aircraft(flight)
-                self.airport.add_aircraft(aircraft)
+            if event == 'spawn':
+                if len(self.airport.aircraft) >= max_aircraft:
+                    # Airport is full - retry next tick without building a backlog,
+                    # so a freed slot spawns one aircraft rather than a burst
+                    heapq.heappush(self._events, (current_time, 'spawn'))
+                    break
                 
-                # Update spawn timing
-                self.last_spawn_time = self.airport.current_time
+                if not self._spawn_scheduled_aircraft(active_aircraft):
+                    # Departure drawn but no gate free - retry next tick
+                    heapq.heappush(self._events, (current_time, 'spawn'))
+                    break
+                self.last_spawn_time = due_time
                 
-                print(f"SPAWN: {aircraft.callsign} [{aircraft.aircraft_type.value}] - {flight_type.upper()}")
+                # Adjust spawn rate based on current traffic density to prevent overcrowding
+                spawn_interval = self._get_spawn_interval(active_aircraft)
+                heapq.heappush(self._events, (due_time + spawn_interval, 'spawn'))
+    
+    def _spawn_scheduled_aircraft(self, active_aircraft: List[Aircraft]) -> bool:
+        """
+        Generate a flight and add its aircraft to the airport.
+        
+        Args:
+            active_aircraft: Active aircraft used for spawn separation; the new
+                aircraft is appended so later spawns in the same tick avoid it
+            
+        Returns:
+            bool: True if an aircraft was spawned, False if a departure was
+                drawn but no gate is available
+        """
+        # Balance traffic: 70% arrivals, 30% departures
+        flight_type = "arrival" if random.random() < 0.7 else "departure"
+        
+        # Departures need a gate; check before building the aircraft
+        gate = None
+        if flight_type == "departure":
+            gate = self.airport.get_available_gate()
+            if gate is None:
+                return False
+        
+        # Generate and spawn the aircraft
+        flight = self.generate_flight(flight_type)
+        aircraft = self.spawn_aircraft(flight, active_aircraft, gate)
+        self.airport.add_aircraft(aircraft)
+        active_aircraft.append(aircraft)
+        
+        print(f"SPAWN: {aircraft.callsign} [{aircraft.aircraft_type.value}] - {flight_type.upper()}")
+        return True
     
     def get_traffic_density(self) -> float:
         """
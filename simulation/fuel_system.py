@@ -8,13 +8,40 @@ This module handles all fuel-related functionality including:
 - Fuel priority management
 """
 
-import math
+import heapq
 import random
-from typing import Dict, List
+import sys
+from typing import Dict, List, Optional
 
 from models.aircraft import Aircraft, AircraftState
 from models.airport import Airport, RunwayState
 from models.position import Position
+from utils.math_utils import ANGLE_TABLE, ANGLE_TABLE_BITS
+
+
+# State groups used for membership tests in the per-aircraft loops
+_TERMINAL_STATES = frozenset({AircraftState.CRASHED, AircraftState.DEPARTED})
+_INBOUND_STATES = frozenset({AircraftState.APPROACHING, AircraftState.HOLDING})
+
+# Holding fuel warning thresholds (minutes of safe holding time left, fuel %)
+# and how often each warning may repeat (seconds)
+_AIRBORNE_WARN_MIN = 5.0
+_AIRBORNE_WARN_MIN_FUEL = 15.0
+_AIRBORNE_CRIT_MIN = 2.0
+_GROUND_WARN_MIN = 10.0
+_GROUND_WARN_MIN_FUEL = 5.0
+_HOLDING_WARN_MIN = 5.0  # WARNING label in get_holding_fuel_status, airborne or ground
+_AIRBORNE_THROTTLE = 30.0
+_CRIT_THROTTLE = 10.0
+_GROUND_THROTTLE = 60.0
+
+# Holding fuel status line: holding type, status label, fuel %, minutes left
+_HOLDING_STATUS_TMPL = "{} holding - {} ({:.1f}%, {:.1f}min left)"
+
+
+def _fuel_priority_key(aircraft: Aircraft) -> tuple:
+    """Sort key putting higher fuel priority first, then lowest fuel first."""
+    return (-aircraft.get_fuel_priority(), aircraft.fuel)
 
 
 class FuelSystem:
@@ -37,11 +64,14 @@ class FuelSystem:
         """
         self.airport = airport
         
-        # Fuel emergency logging throttling (callsign -> last_log_time)
-        self.fuel_emergency_last_logged: Dict[str, float] = {}
-        self.fuel_emergency_log_interval = 10.0  # Log at most once every 10 seconds
+        # Airport geometry is fixed for the lifetime of the simulation
+        airport_config = airport.config.airport
+        self._airport_width = airport_config.airport_width
+        self._airport_height = airport_config.airport_height
+        self._center_x = self._airport_width * 0.5
+        self._center_y = self._airport_height * 0.5
         
-        # New throttling system for improved monitoring
+        # Fuel emergency logging throttling (throttle key -> last_log_time)
         self.fuel_emergency_log_throttle: Dict[str, float] = {}
         self.fuel_log_throttle_interval = 10.0  # Log at most once every 10 seconds
         
@@ -58,91 +88,107 @@ class FuelSystem:
         Args:
             dt (float): Time step in seconds since last update
         """
+        # Bind loop-invariant lookups to locals once
+        CRASHED = AircraftState.CRASHED
+        HOLDING = AircraftState.HOLDING
         current_time = self.airport.current_time
+        throttle = self.fuel_emergency_log_throttle
+        throttle_get = throttle.get
+        interval = self.fuel_log_throttle_interval
+        never = float('-inf')
+        
+        # Collected and written once at the end instead of one print per event
+        messages: List[str] = []
+        log = messages.append
+        
+        # Skip the per-aircraft fuel checks entirely when nobody is low on fuel
+        any_low_fuel = self.airport.low_fuel_count > 0
         
         for aircraft in self.airport.aircraft:
-            if aircraft.state in [AircraftState.CRASHED, AircraftState.DEPARTED]:
+            state = aircraft.state
+            if state in _TERMINAL_STATES:
                 continue
             
             # Monitor fuel emergencies (throttled logging)
-            if aircraft.is_critical_fuel():
-                throttle_key = f"critical_{aircraft.id}"
-                if (throttle_key not in self.fuel_emergency_log_throttle or 
-                    current_time - self.fuel_emergency_log_throttle[throttle_key] >= self.fuel_log_throttle_interval):
+            if any_low_fuel and aircraft.is_critical_fuel():
+                throttle_key = aircraft.fuel_log_keys[0]
+                if current_time - throttle_get(throttle_key, never) >= interval:
                     
-                    self.fuel_emergency_log_throttle[throttle_key] = current_time
-                    if aircraft.state in [AircraftState.APPROACHING, AircraftState.HOLDING]:
-                        print(f"⛽ CRITICAL FUEL: {aircraft.callsign} has {aircraft.fuel:.1f}% fuel - IMMEDIATE LANDING REQUIRED!")
+                    throttle[throttle_key] = current_time
+                    if state in _INBOUND_STATES:
+                        log(f"⛽ CRITICAL FUEL: {aircraft.callsign} has {aircraft.fuel:.1f}% fuel - IMMEDIATE LANDING REQUIRED!")
                         
                         # For holding aircraft, check if they should exit holding immediately
-                        if aircraft.state == AircraftState.HOLDING:
+                        if state == HOLDING:
                             safe_time = aircraft.get_safe_holding_time()
-                            print(f"⚠️  HOLDING ALERT: {aircraft.callsign} in critical fuel state with {safe_time:.1f} minutes safe holding time")
+                            log(f"⚠️  HOLDING ALERT: {aircraft.callsign} in critical fuel state with {safe_time:.1f} minutes safe holding time")
             
-            elif aircraft.is_low_fuel():
-                throttle_key = f"low_{aircraft.id}"
-                if (throttle_key not in self.fuel_emergency_log_throttle or 
-                    current_time - self.fuel_emergency_log_throttle[throttle_key] >= self.fuel_log_throttle_interval):
+            elif any_low_fuel and aircraft.is_low_fuel():
+                throttle_key = aircraft.fuel_log_keys[1]
+                if current_time - throttle_get(throttle_key, never) >= interval:
                     
-                    self.fuel_emergency_log_throttle[throttle_key] = current_time
-                    if aircraft.state in [AircraftState.APPROACHING, AircraftState.HOLDING]:
-                        if aircraft.state == AircraftState.HOLDING:
+                    throttle[throttle_key] = current_time
+                    if state in _INBOUND_STATES:
+                        if state == HOLDING:
                             safe_time = aircraft.get_safe_holding_time()
-                            print(f"⚠️  LOW FUEL HOLDING: {aircraft.callsign} has {aircraft.fuel:.1f}% fuel, {safe_time:.1f} minutes safe holding time")
+                            log(f"⚠️  LOW FUEL HOLDING: {aircraft.callsign} has {aircraft.fuel:.1f}% fuel, {safe_time:.1f} minutes safe holding time")
                         else:
-                            print(f"⚠️  LOW FUEL: {aircraft.callsign} has {aircraft.fuel:.1f}% fuel - priority landing needed")
+                            log(f"⚠️  LOW FUEL: {aircraft.callsign} has {aircraft.fuel:.1f}% fuel - priority landing needed")
             
             # Special monitoring for aircraft in holding patterns
-            if aircraft.state == AircraftState.HOLDING:
-                self._monitor_holding_aircraft_fuel(aircraft, current_time)
+            if state == HOLDING:
+                self._monitor_holding_aircraft_fuel(aircraft, current_time, messages)
             
             # Check for aircraft running out of fuel
-            if aircraft.fuel <= 0.0 and aircraft.state != AircraftState.CRASHED:
-                aircraft.state = AircraftState.CRASHED
+            if aircraft.fuel <= 0.0:
+                self.airport.set_aircraft_state(aircraft, CRASHED)
                 aircraft.crash_reason = "FUEL EXHAUSTION"
-                print(f"💥 FUEL CRASH: {aircraft.callsign} crashed due to fuel exhaustion!")
+                log(f"💥 FUEL CRASH: {aircraft.callsign} crashed due to fuel exhaustion!")
+        
+        if messages:
+            sys.stdout.write("\n".join(messages) + "\n")
     
-    def _monitor_holding_aircraft_fuel(self, aircraft: Aircraft, current_time: float):
+    def _monitor_holding_aircraft_fuel(self, aircraft: Aircraft, current_time: float, messages: List[str]):
         """
         Monitor fuel levels for aircraft in holding patterns with special attention.
         
         Args:
             aircraft (Aircraft): Aircraft in holding pattern
             current_time (float): Current simulation time
+            messages (List[str]): Log lines to append warnings to
         """
         # Check if this is airborne or ground holding
-        is_airborne = not (hasattr(aircraft, 'waiting_for_runway') and aircraft.waiting_for_runway)
+        is_airborne = not aircraft.waiting_for_runway
         
         safe_holding_time = aircraft.get_safe_holding_time()
         
         # Create holding-specific throttle key
-        throttle_key = f"holding_{aircraft.id}"
+        throttle_key = aircraft.fuel_log_keys[2]
+        throttle = self.fuel_emergency_log_throttle
+        last_logged = throttle.get(throttle_key, float('-inf'))
         
         # Different warning thresholds for airborne vs ground holding
         if is_airborne:
             # Airborne holding - more urgent fuel monitoring
-            if safe_holding_time < 5.0 and aircraft.fuel > 15.0:  # Warning when < 5 minutes left
-                if (throttle_key not in self.fuel_emergency_log_throttle or 
-                    current_time - self.fuel_emergency_log_throttle[throttle_key] >= 30.0):  # Every 30 seconds
+            if safe_holding_time < _AIRBORNE_WARN_MIN and aircraft.fuel > _AIRBORNE_WARN_MIN_FUEL:
+                if current_time - last_logged >= _AIRBORNE_THROTTLE:
                     
-                    self.fuel_emergency_log_throttle[throttle_key] = current_time
-                    print(f"⏰ HOLDING TIME WARNING: {aircraft.callsign} airborne holding - only {safe_holding_time:.1f} minutes fuel remaining")
+                    throttle[throttle_key] = current_time
+                    messages.append(f"⏰ HOLDING TIME WARNING: {aircraft.callsign} airborne holding - only {safe_holding_time:.1f} minutes fuel remaining")
             
-            elif safe_holding_time < 2.0:  # Critical - less than 2 minutes
-                if (throttle_key not in self.fuel_emergency_log_throttle or 
-                    current_time - self.fuel_emergency_log_throttle[throttle_key] >= 10.0):  # Every 10 seconds
+            elif safe_holding_time < _AIRBORNE_CRIT_MIN:  # Critical
+                if current_time - last_logged >= _CRIT_THROTTLE:
                     
-                    self.fuel_emergency_log_throttle[throttle_key] = current_time
-                    print(f"🚨 HOLDING EMERGENCY: {aircraft.callsign} MUST EXIT HOLDING NOW - {safe_holding_time:.1f} minutes fuel left!")
+                    throttle[throttle_key] = current_time
+                    messages.append(f"🚨 HOLDING EMERGENCY: {aircraft.callsign} MUST EXIT HOLDING NOW - {safe_holding_time:.1f} minutes fuel left!")
         
         else:
             # Ground holding - less critical but still monitor
-            if safe_holding_time < 10.0 and aircraft.fuel > 5.0:
-                if (throttle_key not in self.fuel_emergency_log_throttle or 
-                    current_time - self.fuel_emergency_log_throttle[throttle_key] >= 60.0):  # Every minute
+            if safe_holding_time < _GROUND_WARN_MIN and aircraft.fuel > _GROUND_WARN_MIN_FUEL:
+                if current_time - last_logged >= _GROUND_THROTTLE:
                     
-                    self.fuel_emergency_log_throttle[throttle_key] = current_time
-                    print(f"⏳ GROUND HOLDING: {aircraft.callsign} ground holding - {safe_holding_time:.1f} minutes fuel remaining")
+                    throttle[throttle_key] = current_time
+                    messages.append(f"⏳ GROUND HOLDING: {aircraft.callsign} ground holding - {safe_holding_time:.1f} minutes fuel remaining")
     
     def get_holding_fuel_status(self, aircraft: Aircraft) -> str:
         """
@@ -158,18 +204,19 @@ class FuelSystem:
             return "Not in holding"
         
         safe_time = aircraft.get_safe_holding_time()
-        is_airborne = not (hasattr(aircraft, 'waiting_for_runway') and aircraft.waiting_for_runway)
+        is_airborne = not aircraft.waiting_for_runway
         
         holding_type = "Airborne" if is_airborne else "Ground"
         
         if aircraft.is_critical_fuel():
-            return f"{holding_type} holding - CRITICAL fuel ({aircraft.fuel:.1f}%, {safe_time:.1f}min left)"
+            status = "CRITICAL fuel"
         elif aircraft.is_low_fuel():
-            return f"{holding_type} holding - LOW fuel ({aircraft.fuel:.1f}%, {safe_time:.1f}min left)"
-        elif safe_time < 5.0:
-            return f"{holding_type} holding - WARNING ({aircraft.fuel:.1f}%, {safe_time:.1f}min left)"
+            status = "LOW fuel"
+        elif safe_time < _HOLDING_WARN_MIN:
+            status = "WARNING"
         else:
-            return f"{holding_type} holding - OK ({aircraft.fuel:.1f}%, {safe_time:.1f}min left)"
+            status = "OK"
+        return _HOLDING_STATUS_TMPL.format(holding_type, status, aircraft.fuel, safe_time)
     
     def handle_critical_fuel_emergencies(self):
         """
@@ -181,17 +228,16 @@ class FuelSystem:
         3. Clears occupied runways by forcing go-arounds
         4. Prioritizes by fuel level (most critical first)
         """
-        # Find critical fuel aircraft that need immediate landing
-        critical_aircraft = [
-            a for a in self.airport.aircraft 
-            if a.is_critical_fuel() and a.state in [AircraftState.APPROACHING, AircraftState.HOLDING]
-        ]
-        
-        if not critical_aircraft:
+        if not self.airport.critical_fuel_aircraft:
             return  # No critical fuel emergencies
         
-        # Sort by fuel level (most critical first)
-        critical_aircraft.sort(key=lambda a: a.fuel)
+        # Find critical fuel aircraft that need immediate landing,
+        # sorted by fuel level (most critical first)
+        critical_aircraft = sorted(
+            (a for a in self.airport.critical_fuel_aircraft.values()
+             if a.state in _INBOUND_STATES),
+            key=lambda a: a.fuel
+        )
         
         for critical_plane in critical_aircraft:
             print(f"🚨 CRITICAL FUEL EMERGENCY: {critical_plane.callsign} has {critical_plane.fuel:.1f}% fuel!")
@@ -242,16 +288,16 @@ class FuelSystem:
                 aircraft.assigned_runway = None
                 
                 # Set aircraft to go-around state and move to holding pattern
-                aircraft.state = AircraftState.GO_AROUND
+                self.airport.set_aircraft_state(aircraft, AircraftState.GO_AROUND)
                 
                 # Set target position for go-around (climb out and circle)
-                center_x = self.airport.config.airport.airport_width / 2
-                center_y = self.airport.config.airport.airport_height / 2
+                center_x = self._center_x
+                center_y = self._center_y
                 go_around_radius = 300
-                angle = random.uniform(0, 2 * math.pi)
+                cos_a, sin_a = ANGLE_TABLE[random.getrandbits(ANGLE_TABLE_BITS)]
                 aircraft.target_position = Position(
-                    center_x + math.cos(angle) * go_around_radius,
-                    center_y + math.sin(angle) * go_around_radius
+                    center_x + cos_a * go_around_radius,
+                    center_y + sin_a * go_around_radius
                 )
                 
                 print(f"🔄 EMERGENCY GO-AROUND: {aircraft.callsign} aborted landing on runway {runway.id} for critical fuel emergency")
@@ -266,25 +312,28 @@ class FuelSystem:
         """
         aircraft.assigned_runway = runway.id
         aircraft.target_position = runway.center_position
-        aircraft.state = AircraftState.LANDING
+        self.airport.set_aircraft_state(aircraft, AircraftState.LANDING)
         runway.state = RunwayState.OCCUPIED_LANDING
         runway.occupied_by = aircraft.id
         print(f"🚨 EMERGENCY LANDING: {aircraft.callsign} cleared for immediate landing on runway {runway.id} (CRITICAL FUEL: {aircraft.fuel:.1f}%)")
     
-    def get_fuel_priority_aircraft(self) -> List[Aircraft]:
+    def get_fuel_priority_aircraft(self, k: Optional[int] = None) -> List[Aircraft]:
         """
         Get list of aircraft sorted by fuel priority (most critical first).
         
+        Args:
+            k (Optional[int]): Only return the k most critical aircraft; all when None
+        
         Returns:
             List[Aircraft]: Aircraft sorted by fuel priority level
         """
-        active_aircraft = [a for a in self.airport.aircraft 
-                          if a.state not in [AircraftState.CRASHED, AircraftState.DEPARTED]]
+        active_aircraft = (a for a in self.airport.aircraft 
+                           if a.state not in _TERMINAL_STATES)
         
-        # Sort by fuel priority (higher priority first, then by fuel level)
-        return sorted(active_aircraft, 
-                     key=lambda a: (a.get_fuel_priority(), -a.fuel), 
-                     reverse=True)
+        if k is not None:
+            # Partial selection instead of sorting everything
+            return heapq.nsmallest(k, active_aircraft, key=_fuel_priority_key)
+        return sorted(active_aircraft, key=_fuel_priority_key)
     
     def get_fuel_emergency_count(self) -> tuple:
         """
@@ -293,14 +342,4 @@ class FuelSystem:
         Returns:
             tuple: (critical_fuel_count, low_fuel_count)
         """
-        critical_count = 0
-        low_fuel_count = 0
-        
-        for aircraft in self.airport.aircraft:
-            if aircraft.state not in [AircraftState.CRASHED, AircraftState.DEPARTED]:
-                if aircraft.is_critical_fuel():
-                    critical_count += 1
-                elif aircraft.is_low_fuel():
-                    low_fuel_count += 1
-        
-        return critical_count, low_fuel_count 
\ No newline at end of file
+        return len(self.airport.critical_fuel_aircraft), len(self.airport.low_fuel_aircraft) 
\ No newline at end of file
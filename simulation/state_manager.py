@@ -10,8 +10,24 @@ import random
 from typing import List
 
 from models.aircraft import Aircraft, AircraftState
-from models.airport import Airport, RunwayState
+from models.airport import Airport, Gate, Runway, RunwayState
 from models.position import Position
+from utils.math_utils import ANGLE_TABLE, ANGLE_TABLE_BITS
+
+
+# Chance per update cycle that an aircraft at the gate requests departure
+_DEPARTURE_CHANCE = 0.15
+_LOG_DEPARTURE_MISS = math.log(1.0 - _DEPARTURE_CHANCE)
+
+# States with nothing to do on reaching their target (parked, holding, or out
+# of the simulation), so the arrival check skips them
+_QUIESCENT_STATES = frozenset({
+    AircraftState.AT_GATE,
+    AircraftState.BOARDING_DEBOARDING,
+    AircraftState.HOLDING,
+    AircraftState.CRASHED,
+    AircraftState.DEPARTED,
+})
 
 
 class StateManager:
@@ -34,53 +50,112 @@ class StateManager:
             airport (Airport): The airport instance to manage aircraft states for
         """
         self.airport = airport
+        
+        # Airport geometry is fixed for the lifetime of the simulation
+        airport_config = airport.config.airport
+        self._airport_width = airport_config.airport_width
+        self._airport_height = airport_config.airport_height
+        self._center_x = self._airport_width * 0.5
+        self._center_y = self._airport_height * 0.5
+        
+        # What happens when an aircraft in each state reaches its target
+        self._transition_table = {
+            AircraftState.LANDING: self._handle_landing_completion,
+            AircraftState.TAXIING_TO_GATE: self._handle_gate_arrival,
+            AircraftState.TAXIING_TO_RUNWAY: self._handle_takeoff_start,
+            AircraftState.TAKING_OFF: self._handle_takeoff_completion,
+            AircraftState.GO_AROUND: self._handle_go_around_completion,
+        }
+        
+        # Per-frame work for each aircraft state, dispatched from tick() in this order
+        self._state_handlers = {
+            AircraftState.LANDING: self._tick_landing,
+            AircraftState.BOARDING_DEBOARDING: self._tick_boarding,
+            AircraftState.AT_GATE: self._tick_at_gate,
+            AircraftState.HOLDING: self._tick_holding,
+        }
+        # Departure requests are Bernoulli trials over AT_GATE aircraft; rather
+        # than one random() per aircraft per frame, draw how many to skip.
+        self._departure_skip = self._draw_departure_skip()
+        
+        # Free runways and gates for the current frame, filled in by tick()
+        self._free_runways: List[Runway] = []
+        self._free_gates: List[Gate] = []
     
     def update_aircraft_states(self, dt: float):
         """
         Update aircraft states based on their positions and targets.
         
-        This method handles automatic state transitions when aircraft
-        reach their target positions and manages the aircraft lifecycle.
+        Refuels aircraft at gates, then handles the automatic state transition
+        of every aircraft that reached its target (landing and takeoff
+        completion, gate arrival, takeoff start, go-around completion).
+        Runs early in the frame so fuel monitoring, collision checks and the
+        AI see the results in the same frame.
         
         Args:
             dt (float): Time step in seconds since last update
         """
         current_time = self.airport.current_time
         
-        # Update refueling for aircraft at gates
-        for aircraft in self.airport.aircraft:
-            if aircraft.state == AircraftState.BOARDING_DEBOARDING:
-                aircraft.update_refueling(current_time, dt)
+        # Fuel only changes while refueling is in progress
+        for aircraft in list(self.airport.by_state[AircraftState.BOARDING_DEBOARDING].values()):
+            if not aircraft.refuel_completed and aircraft.update_refueling(current_time, dt):
+                self.airport.refresh_fuel_state(aircraft)
         
-        # Handle position-based state transitions
         for aircraft in self.airport.aircraft:
-            # Check if aircraft reached their target
-            distance_to_target = aircraft.position.distance_to(aircraft.target_position)
+            if aircraft.state in _QUIESCENT_STATES:
+                continue
             
-            if distance_to_target < 10:  # Close enough to target
+            # Check if aircraft reached their target (squared distance, no sqrt)
+            position = aircraft.position
+            target = aircraft.target_position
+            dx = position.x - target.x
+            dy = position.y - target.y
+            if dx * dx + dy * dy < 100.0:  # Within 10px of target
                 self._handle_state_transition(aircraft)
     
-    def _handle_state_transition(self, aircraft: Aircraft):
+    def tick(self, dt: float):
         """
-        Handle state transitions when aircraft reach their targets.
+        Run the per-state ground operations for one frame.
+        
+        Each state bucket is handed to the per-frame handler for that state:
+        gate assignment after landing, release from the gate once boarding and
+        refueling finish, departure scheduling and runway clearance from
+        holding. Runs at the end of the frame, after fuel emergency handling
+        and the AI, so critical fuel arrivals get first claim on free runways.
         
         Args:
-            aircraft (Aircraft): The aircraft that has reached its target
+            dt (float): Time step in seconds since last update
         """
-        if aircraft.state == AircraftState.LANDING:
-            self._handle_landing_completion(aircraft)
-        
-        elif aircraft.state == AircraftState.TAXIING_TO_GATE:
-            self._handle_gate_arrival(aircraft)
+        current_time = self.airport.current_time
+        state_handlers = self._state_handlers
         
-        elif aircraft.state == AircraftState.TAXIING_TO_RUNWAY:
-            self._handle_takeoff_start(aircraft)
+        # Look free runways and gates up once; handlers take the lowest id from
+        # these lists when assigning and put back what they release in id order
+        self._free_runways = self.airport.get_available_runways()
+        self._free_gates = self.airport.get_available_gates()
         
-        elif aircraft.state == AircraftState.TAKING_OFF:
-            self._handle_takeoff_completion(aircraft)
+        # Per-state work only visits aircraft in that state's bucket, and stops
+        # early once a handler reports the rest of the bucket has nothing to do.
+        # Buckets are copied since handlers move aircraft between them.
+        by_state = self.airport.by_state
+        for state, handler in state_handlers.items():
+            bucket = by_state[state]
+            if bucket:
+                for aircraft in list(bucket.values()):
+                    if handler(aircraft, dt, current_time):
+                        break
+    
+    def _handle_state_transition(self, aircraft: Aircraft):
+        """
+        Handle state transitions when aircraft reach their targets.
         
-        elif aircraft.state == AircraftState.GO_AROUND:
-            self._handle_go_around_completion(aircraft)
+        Args:
+            aircraft (Aircraft): The aircraft that has reached its target
+        """
+        handler = self._transition_table.get(aircraft.state)
+        if handler:
+            handler(aircraft)
     
     def _handle_landing_completion(self, aircraft: Aircraft):
         """
@@ -101,7 +176,7 @@ class StateManager:
             # Assign gate and start taxiing
             aircraft.assigned_gate = gate.id
             aircraft.target_position = gate.position
-            aircraft.state = AircraftState.TAXIING_TO_GATE
+            self.airport.set_aircraft_state(aircraft, AircraftState.TAXIING_TO_GATE)
             gate.occupied_by = aircraft.id
             aircraft.assigned_runway = None
             print(f"AUTO-GATE: {aircraft.callsign} assigned to gate {gate.id}")
@@ -116,7 +191,7 @@ class StateManager:
         Args:
             aircraft (Aircraft): The aircraft that arrived at the gate
         """
-        aircraft.state = AircraftState.BOARDING_DEBOARDING
+        self.airport.set_aircraft_state(aircraft, AircraftState.BOARDING_DEBOARDING)
         
         # Start gate operations (boarding/deboarding and refueling)
         current_time = self.airport.current_time
@@ -131,19 +206,10 @@ class StateManager:
         Args:
             aircraft (Aircraft): The aircraft starting takeoff
         """
-        aircraft.state = AircraftState.TAKING_OFF
+        self.airport.set_aircraft_state(aircraft, AircraftState.TAKING_OFF)
         # Set takeoff target (off the screen)
         runway = self.airport.runways[aircraft.assigned_runway]
-        direction_x = runway.end_position.x - runway.start_position.x
-        direction_y = runway.end_position.y - runway.start_position.y
-        length = math.sqrt(direction_x**2 + direction_y**2)
-        direction_x /= length
-        direction_y /= length
-        
-        aircraft.target_position = Position(
-            runway.end_position.x + direction_x * 500,
-            runway.end_position.y + direction_y * 500
-        )
+        aircraft.target_position = runway.takeoff_target
         print(f"TAKEOFF: {aircraft.callsign} taking off from runway {aircraft.assigned_runway}")
     
     def _handle_takeoff_completion(self, aircraft: Aircraft):
@@ -154,9 +220,9 @@ class StateManager:
             aircraft (Aircraft): The aircraft completing takeoff
         """
         # Check if aircraft is off screen
-        if (aircraft.position.x < -100 or aircraft.position.x > self.airport.config.airport.airport_width + 100 or
-            aircraft.position.y < -100 or aircraft.position.y > self.airport.config.airport.airport_height + 100):
-            aircraft.state = AircraftState.DEPARTED
+        if (aircraft.position.x < -100 or aircraft.position.x > self._airport_width + 100 or
+            aircraft.position.y < -100 or aircraft.position.y > self._airport_height + 100):
+            self.airport.set_aircraft_state(aircraft, AircraftState.DEPARTED)
             # Free up runway
             if aircraft.assigned_runway is not None:
                 runway = self.airport.runways[aircraft.assigned_runway]
@@ -172,93 +238,145 @@ class StateManager:
             aircraft (Aircraft): The aircraft completing go-around
         """
         # Aircraft completed go-around, transition back to holding for another landing attempt
-        aircraft.state = AircraftState.HOLDING
+        self.airport.set_aircraft_state(aircraft, AircraftState.HOLDING)
         print(f"🔄 GO-AROUND COMPLETE: {aircraft.callsign} now holding, ready for another landing attempt")
     
-    def assign_gates_to_waiting_aircraft(self):
+    def _tick_landing(self, aircraft: Aircraft, dt: float, current_time: float) -> bool:
         """
-        Assign gates to aircraft waiting after landing.
+        Assign a gate to an aircraft that landed but is still waiting on the runway.
         
-        This method checks for aircraft that landed but are waiting for gates
-        and assigns them to available gates as they become free.
+        Args:
+            aircraft (Aircraft): The landing aircraft
+            dt (float): Time step in seconds since last update
+            current_time (float): Current simulation time
+            
+        Returns:
+            bool: True if no other aircraft in this state needs handling this frame
         """
-        # Find aircraft waiting for gates (landed but still on runway)
-        waiting_aircraft = [a for a in self.airport.aircraft 
-                          if a.state == AircraftState.LANDING and a.assigned_gate is None]
+        if aircraft.assigned_gate is not None or aircraft.assigned_runway is None:
+            return False
         
-        for aircraft in waiting_aircraft:
-            # Check if aircraft is close to runway (has completed landing)
-            if aircraft.assigned_runway is not None:
-                runway = self.airport.runways[aircraft.assigned_runway]
-                if aircraft.position.distance_to(runway.center_position) < 20:
-                    # Try to assign a gate
-                    gate = self.airport.get_available_gate()
-                    if gate:
-                        # Assign gate and start taxiing
-                        aircraft.assigned_gate = gate.id
-                        aircraft.target_position = gate.position
-                        aircraft.state = AircraftState.TAXIING_TO_GATE
-                        gate.occupied_by = aircraft.id
-                        
-                        # Free up runway
-                        runway.state = RunwayState.AVAILABLE
-                        runway.occupied_by = None
-                        aircraft.assigned_runway = None
-                        
-                        print(f"GATE-ASSIGNED: {aircraft.callsign} assigned to gate {gate.id}")
+        # Check if aircraft is close to runway (has completed landing)
+        runway = self.airport.runways[aircraft.assigned_runway]
+        if aircraft.position.distance_sq_to(runway.center_position) < 400.0:  # Within 20px
+            # Try to assign a gate
+            if self._free_gates:
+                gate = self._free_gates.pop(0)
+                
+                # Assign gate and start taxiing
+                aircraft.assigned_gate = gate.id
+                aircraft.target_position = gate.position
+                self.airport.set_aircraft_state(aircraft, AircraftState.TAXIING_TO_GATE)
+                gate.occupied_by = aircraft.id
+                
+                # Free up runway
+                runway.state = RunwayState.AVAILABLE
+                runway.occupied_by = None
+                aircraft.assigned_runway = None
+                self._release(self._free_runways, runway)
+                
+                print(f"GATE-ASSIGNED: {aircraft.callsign} assigned to gate {gate.id}")
+        return False
     
-    def schedule_departures(self):
+    def _tick_boarding(self, aircraft: Aircraft, dt: float, current_time: float) -> bool:
         """
-        Automatically schedule departures for aircraft that have been at gates long enough.
+        Release an aircraft from the gate once gate operations finish.
         
-        This method manages the boarding/deboarding process and schedules departures
-        when aircraft are ready to leave the gate (both boarding and refueling complete).
+        Args:
+            aircraft (Aircraft): The aircraft boarding/deboarding at a gate
+            dt (float): Time step in seconds since last update
+            current_time (float): Current simulation time
+            
+        Returns:
+            bool: True if no other aircraft in this state needs handling this frame
         """
-        current_time = self.airport.current_time
+        # Check if aircraft is ready for departure (both boarding and refueling complete)
+        if aircraft.is_ready_for_departure(current_time):
+            self.airport.set_aircraft_state(aircraft, AircraftState.AT_GATE)
+            
+            # Get status information for logging
+            gate_status = aircraft.get_gate_status(current_time)
+            print(f"GATE OPERATIONS COMPLETE: {aircraft.callsign} ready for departure | {gate_status}")
+        return False
+    
+    def _tick_at_gate(self, aircraft: Aircraft, dt: float, current_time: float) -> bool:
+        """
+        Try to schedule the departure of an aircraft that is ready at its gate.
         
-        # Handle boarding/deboarding and refueling completion
-        for aircraft in self.airport.aircraft:
-            if aircraft.state == AircraftState.BOARDING_DEBOARDING:
-                # Check if aircraft is ready for departure (both boarding and refueling complete)
-                if aircraft.is_ready_for_departure(current_time):
-                    aircraft.state = AircraftState.AT_GATE
-                    
-                    # Get status information for logging
-                    gate_status = aircraft.get_gate_status(current_time)
-                    print(f"GATE OPERATIONS COMPLETE: {aircraft.callsign} ready for departure | {gate_status}")
-        
-        # Schedule departures for aircraft that are ready at gates
-        for aircraft in self.airport.aircraft:
-            if aircraft.state == AircraftState.AT_GATE:
-                # Aircraft ready for departure - try to assign runway
-                if random.random() < 0.15:  # 15% chance per update cycle (slightly higher for refueled aircraft)
-                    runway = self.airport.get_available_runway()
-                    if runway:
-                        # Clear gate and assign runway
-                        if aircraft.assigned_gate is not None:
-                            gate = self.airport.gates[aircraft.assigned_gate]
-                            gate.occupied_by = None
-                        
-                        aircraft.assigned_runway = runway.id
-                        aircraft.target_position = runway.center_position
-                        aircraft.state = AircraftState.TAXIING_TO_RUNWAY
-                        runway.state = RunwayState.OCCUPIED_TAKEOFF
-                        runway.occupied_by = aircraft.id
-                        aircraft.assigned_gate = None
-                        
-                        # Log departure with fuel and passenger information
-                        total_gate_time = aircraft.get_total_gate_time()
-                        print(f"DEPARTURE: {aircraft.callsign} cleared for takeoff on runway {runway.id}")
-                        print(f"├─ Fuel: {aircraft.fuel:.1f}% (refueled from {aircraft.fuel_at_arrival:.1f}%)")
-                        print(f"├─ Passengers: {aircraft.passenger_count}")
-                        print(f"└─ Gate time: {total_gate_time:.1f}s (boarding + refueling)")
-                        break
-                    else:
-                        # No runway available - move to holding area
-                        if not hasattr(aircraft, 'waiting_for_runway'):
-                            aircraft.waiting_for_runway = True
-                            self._move_to_holding_area(aircraft)
-                            break
+        Args:
+            aircraft (Aircraft): The aircraft waiting at the gate
+            dt (float): Time step in seconds since last update
+            current_time (float): Current simulation time
+            
+        Returns:
+            bool: True if no other aircraft in this state needs handling this frame
+        """
+        # Aircraft ready for departure - 15% chance per update cycle to request a runway
+        if self._departure_skip > 0:
+            self._departure_skip -= 1
+            return False
+        self._departure_skip = self._draw_departure_skip()
+        
+        if self._free_runways:
+            runway = self._free_runways.pop(0)
+            
+            # Clear gate and assign runway
+            if aircraft.assigned_gate is not None:
+                gate = self.airport.gates[aircraft.assigned_gate]
+                gate.occupied_by = None
+                self._release(self._free_gates, gate)
+            
+            aircraft.assigned_runway = runway.id
+            aircraft.target_position = runway.center_position
+            self.airport.set_aircraft_state(aircraft, AircraftState.TAXIING_TO_RUNWAY)
+            runway.state = RunwayState.OCCUPIED_TAKEOFF
+            runway.occupied_by = aircraft.id
+            aircraft.assigned_gate = None
+            
+            # Log departure with fuel and passenger information
+            total_gate_time = aircraft.get_total_gate_time()
+            print(f"DEPARTURE: {aircraft.callsign} cleared for takeoff on runway {runway.id}")
+            print(f"├─ Fuel: {aircraft.fuel:.1f}% (refueled from {aircraft.fuel_at_arrival:.1f}%)")
+            print(f"├─ Passengers: {aircraft.passenger_count}")
+            print(f"└─ Gate time: {total_gate_time:.1f}s (boarding + refueling)")
+            return True  # One departure decision per frame
+        elif not aircraft.waiting_for_runway:
+            # No runway available - move to holding area
+            aircraft.waiting_for_runway = True
+            self._move_to_holding_area(aircraft)
+            return True
+        return False
+    
+    @staticmethod
+    def _draw_departure_skip() -> int:
+        """
+        Draw how many departure checks fail before the next one succeeds.
+        
+        Returns:
+            int: Geometrically distributed count of checks to skip
+        """
+        # 1 - random() lies in (0, 1], so the log is always defined
+        return int(math.log(1.0 - random.random()) / _LOG_DEPARTURE_MISS)
+    
+    @staticmethod
+    def _release(free: list, resource) -> None:
+        """
+        Put a freed runway or gate back on this frame's free list.
+        
+        The list stays in id order, so pop(0) picks the same lowest-id runway or
+        gate that get_available_runway() and get_available_gate() would.
+        
+        Args:
+            free (list): The frame's free runways or free gates
+            resource: The runway or gate that was just freed
+        """
+        for index, other in enumerate(free):
+            if other is resource:
+                return
+            if other.id > resource.id:
+                free.insert(index, resource)
+                return
+        free.append(resource)
     
     def _move_to_holding_area(self, aircraft: Aircraft):
         """
@@ -267,45 +385,52 @@ class StateManager:
         Args:
             aircraft (Aircraft): The aircraft to move to holding area
         """
-        center_x = self.airport.config.airport.airport_width / 2
-        center_y = self.airport.config.airport.airport_height / 2
+        center_x = self._center_x
+        center_y = self._center_y
         hold_radius = 150
-        angle = random.uniform(0, 2 * math.pi)
         
         if aircraft.assigned_gate is not None:
             gate = self.airport.gates[aircraft.assigned_gate]
             gate.occupied_by = None
             aircraft.assigned_gate = None
+            self._release(self._free_gates, gate)
         
+        cos_a, sin_a = ANGLE_TABLE[random.getrandbits(ANGLE_TABLE_BITS)]
         aircraft.target_position = Position(
-            center_x + math.cos(angle) * hold_radius,
-            center_y + math.sin(angle) * hold_radius
+            center_x + cos_a * hold_radius,
+            center_y + sin_a * hold_radius
         )
-        aircraft.state = AircraftState.HOLDING
+        self.airport.set_aircraft_state(aircraft, AircraftState.HOLDING)
         print(f"HOLDING: {aircraft.callsign} moved to holding area (no runway available)")
     
-    def process_holding_aircraft(self):
+    def _tick_holding(self, aircraft: Aircraft, dt: float, current_time: float) -> bool:
         """
-        Process aircraft in holding patterns waiting for runway assignments.
+        Clear a departing aircraft in the holding area for takeoff once a runway frees up.
         
-        This method manages aircraft that are waiting in holding patterns
-        and assigns them runways when they become available.
+        Args:
+            aircraft (Aircraft): The holding aircraft
+            dt (float): Time step in seconds since last update
+            current_time (float): Current simulation time
+            
+        Returns:
+            bool: True if no other aircraft in this state needs handling this frame
         """
-        holding_aircraft = [a for a in self.airport.aircraft 
-                          if a.state == AircraftState.HOLDING and hasattr(a, 'waiting_for_runway')]
+        if not aircraft.waiting_for_runway:
+            return False
         
-        for aircraft in holding_aircraft:
-            runway = self.airport.get_available_runway()
-            if runway:
-                # Assign runway for takeoff
-                aircraft.assigned_runway = runway.id
-                aircraft.target_position = runway.center_position
-                aircraft.state = AircraftState.TAXIING_TO_RUNWAY
-                runway.state = RunwayState.OCCUPIED_TAKEOFF
-                runway.occupied_by = aircraft.id
-                
-                # Clear waiting flag
-                delattr(aircraft, 'waiting_for_runway')
-                
-                print(f"RUNWAY-CLEARED: {aircraft.callsign} assigned runway {runway.id} from holding")
-                break 
\ No newline at end of file
+        if self._free_runways:
+            runway = self._free_runways.pop(0)
+            
+            # Assign runway for takeoff
+            aircraft.assigned_runway = runway.id
+            aircraft.target_position = runway.center_position
+            self.airport.set_aircraft_state(aircraft, AircraftState.TAXIING_TO_RUNWAY)
+            runway.state = RunwayState.OCCUPIED_TAKEOFF
+            runway.occupied_by = aircraft.id
+            
+            # Clear waiting flag
+            aircraft.waiting_for_runway = False
+            
+            print(f"RUNWAY-CLEARED: {aircraft.callsign} assigned runway {runway.id} from holding")
+        # One clearance per frame; with no runway free the rest must keep holding too
+        return True
@@ -0,0 +1,9 @@
+"""
+Shared pytest setup for the AI Airport Simulation tests.
+"""
+
+import os
+import sys
+
+# Make the top-level modules (config, models, simulation, ...) importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
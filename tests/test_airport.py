@@ -0,0 +1,71 @@
+"""
+Tests for the Airport aircraft indexes: state buckets and fuel emergency tracking.
+"""
+
+from config import get_config
+from models.aircraft import Aircraft, AircraftState
+from models.airport import Airport
+
+
+def _assert_buckets_match(airport: Airport):
+    for state, bucket in airport.by_state.items():
+        expected = {a.id for a in airport.aircraft if a.state == state}
+        assert set(bucket) == expected, state
+
+
+def test_state_buckets_follow_add_set_and_remove():
+    airport = Airport(get_config())
+    first = Aircraft(state=AircraftState.APPROACHING)
+    second = Aircraft(state=AircraftState.AT_GATE)
+    airport.add_aircraft(first)
+    airport.add_aircraft(second)
+    _assert_buckets_match(airport)
+    
+    airport.set_aircraft_state(first, AircraftState.LANDING)
+    assert first.state == AircraftState.LANDING
+    _assert_buckets_match(airport)
+    
+    airport.remove_aircraft(second)
+    _assert_buckets_match(airport)
+    
+    airport.clear_aircraft()
+    assert all(not bucket for bucket in airport.by_state.values())
+
+
+def test_set_state_on_unadded_aircraft_does_not_bucket_it():
+    airport = Airport(get_config())
+    aircraft = Aircraft(state=AircraftState.APPROACHING)
+    
+    airport.set_aircraft_state(aircraft, AircraftState.HOLDING)
+    
+    assert aircraft.state == AircraftState.HOLDING
+    assert aircraft.id not in airport.by_state[AircraftState.HOLDING]
+
+
+def test_fuel_tracking_follows_threshold_crossings():
+    airport = Airport(get_config())
+    aircraft = Aircraft(state=AircraftState.APPROACHING, fuel=25.01)
+    aircraft.target_position = aircraft.position
+    airport.add_aircraft(aircraft)
+    assert airport.low_fuel_count == 0
+    
+    # 0.15%/s while approaching: one second drops it below 25%
+    airport.update(1.0)
+    assert aircraft.id in airport.low_fuel_aircraft
+    
+    aircraft.fuel = 15.05
+    airport.update(1.0)
+    assert aircraft.id in airport.critical_fuel_aircraft
+    assert aircraft.id not in airport.low_fuel_aircraft
+
+
+def test_crash_drops_aircraft_from_fuel_tracking():
+    airport = Airport(get_config())
+    aircraft = Aircraft(state=AircraftState.APPROACHING, fuel=10.0)
+    airport.add_aircraft(aircraft)
+    assert aircraft.id in airport.critical_fuel_aircraft
+    
+    airport.set_aircraft_state(aircraft, AircraftState.CRASHED)
+    
+    assert airport.critical_fuel_aircraft == {}
+    assert airport.low_fuel_count == 0
@@ -0,0 +1,117 @@
+"""
+Tests for spawn safety checks and spawn scheduling in FlightScheduler.
+"""
+
+from config import get_config
+from models.aircraft import Aircraft, AircraftState
+from models.airport import Airport
+from models.position import Position
+from simulation.flight_scheduler import FlightScheduler
+
+
+def _make_scheduler() -> FlightScheduler:
+    return FlightScheduler(Airport(get_config()))
+
+
+def _inbound(x: float, y: float, target_x: float, target_y: float) -> Aircraft:
+    return Aircraft(
+        position=Position(x, y),
+        target_position=Position(target_x, target_y),
+        speed=150.0,
+        state=AircraftState.APPROACHING,
+    )
+
+
+def test_converging_pair_rejected_by_cpa_prediction():
+    scheduler = _make_scheduler()
+    spawn = Position(0.0, 0.0)
+    
+    # Head-on traffic 600px away, flying towards a target far behind the spawn
+    other = _inbound(600.0, 0.0, -1000.0, 0.0)
+    
+    # The old static test (current and target positions only) accepts this spawn
+    assert spawn.distance_to(other.position) >= scheduler.min_spawn_separation
+    assert spawn.distance_to(other.target_position) >= scheduler.min_spawn_separation * 0.7
+    
+    # Closing at 300px/s, the two meet within the lookahead window
+    assert not scheduler._is_spawn_position_safe(spawn, [other], (150.0, 0.0))
+
+
+def test_diverging_pair_accepted():
+    scheduler = _make_scheduler()
+    spawn = Position(0.0, 0.0)
+    other = _inbound(600.0, 0.0, 1600.0, 0.0)
+    
+    assert scheduler._is_spawn_position_safe(spawn, [other], (-150.0, 0.0))
+
+
+def test_spawn_near_distant_aircraft_target_accepted():
+    scheduler = _make_scheduler()
+    spawn = Position(0.0, 0.0)
+    
+    # Heading for a point right next to the spawn, but about 9 s away from it
+    other = _inbound(1000.0, 1000.0, 50.0, 0.0)
+    
+    # The old static test rejected any spawn this close to a target position
+    assert spawn.distance_to(other.target_position) < scheduler.min_spawn_separation * 0.7
+    
+    assert scheduler._is_spawn_position_safe(spawn, [other])
+
+
+def test_spawn_near_target_reached_within_lookahead_rejected():
+    scheduler = _make_scheduler()
+    spawn = Position(0.0, 0.0)
+    
+    # Clear of the spawn now, but reaches its target beside it in 2 s
+    other = _inbound(350.0, 0.0, 50.0, 0.0)
+    assert spawn.distance_to(other.position) >= scheduler.min_spawn_separation
+    
+    assert not scheduler._is_spawn_position_safe(spawn, [other])
+
+
+def test_update_spawns_once_per_due_event():
+    scheduler = _make_scheduler()
+    airport = scheduler.airport
+    first_due = scheduler._events[0][0]
+    
+    airport.current_time = first_due - 0.01
+    scheduler.update(0.0)
+    assert airport.aircraft == []
+    
+    airport.current_time = first_due
+    scheduler.update(0.0)
+    assert len(airport.aircraft) == 1
+    assert scheduler.last_spawn_time == first_due
+    
+    # Exactly one follow-up event, scheduled after the spawn that just fired
+    assert len(scheduler._events) == 1
+    assert scheduler._events[0][0] > first_due
+
+
+def test_full_airport_retries_without_backlog():
+    scheduler = _make_scheduler()
+    airport = scheduler.airport
+    for _ in range(20):
+        airport.add_aircraft(_inbound(100.0, 100.0, 100.0, 100.0))
+    
+    # Several spawn intervals pass while the airport is full
+    airport.current_time = scheduler._events[0][0] + 60.0
+    scheduler.update(0.0)
+    
+    assert len(airport.aircraft) == 20
+    assert scheduler._events == [(airport.current_time, 'spawn')]
+
+
+def test_reset_replaces_stale_events():
+    scheduler = _make_scheduler()
+    airport = scheduler.airport
+    airport.current_time = 500.0
+    scheduler._events[:] = [(10.0, 'spawn'), (20.0, 'spawn'), (900.0, 'spawn')]
+    scheduler.last_spawn_sectors.extend([1, 2, 3])
+    
+    scheduler.reset()
+    
+    assert len(scheduler._events) == 1
+    assert scheduler._events[0][0] > airport.current_time
+    assert scheduler.last_spawn_time == airport.current_time
+    assert scheduler.last_spawn_sectors == []
@@ -0,0 +1,46 @@
+"""
+Tests for the JSON-lines simulation log and get_log_summary.
+"""
+
+import logging
+
+from models.aircraft import Aircraft, AircraftState
+from utils.logging_utils import (
+    _JsonLineFormatter, get_log_summary, log_collision_event, log_crash,
+    log_fuel_emergency, log_system_event
+)
+
+
+def test_log_summary_counts_every_logged_event(tmp_path):
+    log_path = tmp_path / "simulation.log"
+    handler = logging.FileHandler(log_path)
+    handler.setFormatter(_JsonLineFormatter())
+    logger = logging.getLogger('airport_simulation.test_summary')
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(handler)
+    
+    first = Aircraft(state=AircraftState.APPROACHING)
+    second = Aircraft(state=AircraftState.HOLDING)
+    try:
+        log_collision_event(first, second, "COLLISION", logger)
+        log_collision_event(first, second, "WARNING", logger)
+        log_collision_event(first, second, "NEAR_MISS", logger)
+        log_crash(first, "COLLISION", {}, logger)
+        log_fuel_emergency(second, "CRITICAL", logger)
+        log_system_event("STARTUP", "COLLISION checks enabled", logger=logger)
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+    
+    summary = get_log_summary(str(log_path))
+    
+    assert summary == {
+        "total_lines": 6,
+        "error_count": 2,
+        "warning_count": 3,
+        "info_count": 1,
+        "crash_count": 1,
+        "fuel_emergency_count": 1,
+        "collision_count": 3,
+    }
@@ -0,0 +1,27 @@
+"""
+Tests for the batch helpers in utils.math_utils.
+"""
+
+import itertools
+import random
+
+import numpy as np
+
+from utils.math_utils import pairs_within
+
+
+def _brute_force_pairs(xy, radius):
+    return [[i, j] for i, j in itertools.combinations(range(len(xy)), 2)
+            if np.hypot(*(xy[i] - xy[j])) <= radius]
+
+
+def test_pairs_within_matches_brute_force():
+    rng = random.Random(7)
+    for n in (0, 1, 2, 10, 60):
+        xy = np.array([(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(n)]).reshape(-1, 2)
+        assert pairs_within(xy, 250.0).tolist() == _brute_force_pairs(xy, 250.0)
+
+
+def test_pairs_within_includes_pairs_exactly_on_the_radius():
+    xy = np.array([(0.0, 0.0), (300.0, 400.0), (1000.0, 0.0)])
+    assert pairs_within(xy, 500.0).tolist() == [[0, 1]]
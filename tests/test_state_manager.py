@@ -0,0 +1,20 @@
+"""
+Tests for the StateManager per-frame free runway and gate lists.
+"""
+
+from config import get_config
+from models.airport import Airport
+from simulation.state_manager import StateManager
+
+
+def test_release_keeps_free_list_in_id_order():
+    airport = Airport(get_config())
+    first, second, third = airport.gates[:3]
+    free = [first, third]
+    
+    StateManager._release(free, second)
+    assert free == [first, second, third]
+    
+    # Already free: not added twice
+    StateManager._release(free, second)
+    assert [gate.id for gate in free] == [first.id, second.id, third.id]
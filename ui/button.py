@@ -9,6 +9,10 @@ import pygame
 from typing import Callable, Optional, Tuple
 
 
+# Event types a button reacts to; everything else is ignored up front
+_HANDLED = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN))
+
+
 class Button:
     """
     A simple button UI element with click handling and hover effects.
@@ -20,6 +24,10 @@ class Button:
     - Text rendering with automatic centering
     """
     
+    # Buttons are touched on every event and frame; slots skip the per-instance __dict__
+    __slots__ = ('rect', 'text', 'callback', 'hovered', 'font', 'colors',
+                 '_normal_surface', '_hover_surface', '_converted')
+    
     def __init__(self, 
                  x: int, 
                  y: int, 
@@ -55,6 +63,49 @@ class Button:
             'text': (255, 255, 255),
             'border': (255, 255, 255)
         }
+        
+        # Normal and hover appearances are composed once; rendering text and
+        # drawing rects every frame is expensive
+        self._build_cache()
+    
+    def _build_cache(self):
+        """Compose the normal and hover button surfaces (background, border and text)."""
+        text_surface = self.font.render(self.text, True, self.colors['text'])
+        self._normal_surface = self._compose(self.colors['normal'], text_surface)
+        self._hover_surface = self._compose(self.colors['hover'], text_surface)
+        self._converted = False
+        self._convert_cache()
+    
+    def _convert_cache(self):
+        """
+        Convert the cached surfaces to the display's pixel format.
+        
+        Blits then need no per-pixel format conversion. Does nothing until a
+        display mode has been set; draw() retries in that case.
+        """
+        if pygame.display.get_surface() is None:
+            return
+        self._normal_surface = self._normal_surface.convert()
+        self._hover_surface = self._hover_surface.convert()
+        self._converted = True
+    
+    def _compose(self, background_color, text_surface):
+        """
+        Compose one button appearance.
+        
+        Args:
+            background_color: Fill color for the button background
+            text_surface: Rendered button text
+            
+        Returns:
+            pygame.Surface: Button-sized surface with background, border and centered text
+        """
+        surface = pygame.Surface(self.rect.size)
+        surface.fill(background_color)
+        local_rect = surface.get_rect()
+        pygame.draw.rect(surface, self.colors['border'], local_rect, 2)
+        surface.blit(text_surface, text_surface.get_rect(center=local_rect.center))
+        return surface
     
     def handle_event(self, event) -> bool:
         """
@@ -66,14 +117,18 @@ class Button:
         Returns:
             bool: True if the event was handled (button was clicked)
         """
-        if event.type == pygame.MOUSEMOTION:
+        event_type = event.type
+        if event_type not in _HANDLED:
+            return False
+        
+        if event_type == pygame.MOUSEMOTION:
             self.hovered = self.rect.collidepoint(event.pos)
             return False
         
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if self.hovered and self.callback:
-                self.callback()
-                return True
+        # Otherwise it is a mouse button press
+        if self.hovered and self.callback:
+            self.callback()
+            return True
         
         return False
     
@@ -84,19 +139,13 @@ class Button:
         Args:
             screen: Pygame surface to draw on
         """
-        # Choose button color based on hover state
-        button_color = self.colors['hover'] if self.hovered else self.colors['normal']
-        
-        # Draw button background
-        pygame.draw.rect(screen, button_color, self.rect)
-        
-        # Draw button border
-        pygame.draw.rect(screen, self.colors['border'], self.rect, 2)
+        # Buttons created before the display was set up convert on first draw
+        if not self._converted:
+            self._convert_cache()
         
-        # Render and center text
-        text_surface = self.font.render(self.text, True, self.colors['text'])
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        # Choose the pre-composed appearance based on hover state
+        surface = self._hover_surface if self.hovered else self._normal_surface
+        screen.blit(surface, self.rect)
     
     def set_position(self, x: int, y: int):
         """
@@ -106,8 +155,7 @@ class Button:
             x (int): New X position
             y (int): New Y position
         """
-        self.rect.x = x
-        self.rect.y = y
+        self.rect.topleft = (x, y)
     
     def set_size(self, width: int, height: int):
         """
@@ -117,8 +165,8 @@ class Button:
             width (int): New width
             height (int): New height
         """
-        self.rect.width = width
-        self.rect.height = height
+        self.rect.size = (width, height)
+        self._build_cache()
     
     def set_text(self, text: str):
         """
@@ -128,6 +176,21 @@ class Button:
             text (str): New text to display
         """
         self.text = text
+        self._build_cache()
+    
+    def set_colors(self, colors: dict):
+        """
+        Update button colors.
+        
+        Use this rather than editing the colors dict directly, so the cached
+        button surfaces are rebuilt.
+        
+        Args:
+            colors (dict): Colors to change, keyed by 'normal', 'hover', 'text'
+                or 'border'; keys left out keep their current color
+        """
+        self.colors = {**self.colors, **colors}
+        self._build_cache()
     
     def is_clicked(self, pos: Tuple[int, int]) -> bool:
         """
@@ -5,14 +5,16 @@ This package contains reusable utility functions for logging,
 mathematics, and other common operations used throughout the simulation.
 """
 
-from .logging_utils import setup_logging, log_aircraft_decision, log_crash
-from .math_utils import distance, normalize_vector, clamp, random_position_in_circle
+from .logging_utils import setup_logging, stop_logging, log_aircraft_decision, log_crash
+from .math_utils import distance, distance_sq, normalize_vector, clamp, random_position_in_circle
 
 __all__ = [
     'setup_logging',
+    'stop_logging',
     'log_aircraft_decision', 
     'log_crash',
     'distance',
+    'distance_sq',
     'normalize_vector',
     'clamp',
     'random_position_in_circle'
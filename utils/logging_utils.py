@@ -6,14 +6,75 @@ AI decision logging system with additional crash reporting, performance
 monitoring, and general system logging capabilities.
 """
 
+import atexit
+import json
 import logging
+import logging.handlers
+import mmap
 import os
+import queue
+import re
 from datetime import datetime
 from typing import Dict, Any, Optional
 
 from models.aircraft import Aircraft
 
 
+# Looked up once and shared by the log_* helpers; getLogger() takes the
+# logging module lock on every call
+_default_logger = logging.getLogger('airport_simulation')
+
+# Background thread that writes queued records to the real handlers
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+# Fixed shape of a decision log message, formatted in one call instead of
+# building a dict of pre-formatted strings
+_DECISION_TMPL = (
+    "id={id} cs={callsign} state={state} fuel={fuel:.1f}% "
+    "pos=({posx:.0f},{posy:.0f}) decision={decision} why={why}"
+)
+
+# Level and event fields of a JSON log line. The formatter writes them in a
+# fixed order ahead of the message, and quotes inside the message are escaped,
+# so message text can never match. COLLISION also covers every COLLISION_<type>
+# tag written by log_collision_event, whatever its event_type.
+_SUMMARY_PATTERN = re.compile(
+    rb'"level":"(DEBUG|INFO|WARNING|ERROR|CRITICAL)"'
+    rb'(?:,"event":"(CRASH|FUEL_EMERGENCY|COLLISION)(?:_[^"]*)?")?'
+)
+_SUMMARY_COUNTERS = {
+    b"ERROR": "error_count",
+    b"WARNING": "warning_count",
+    b"INFO": "info_count",
+    b"CRASH": "crash_count",
+    b"FUEL_EMERGENCY": "fuel_emergency_count",
+    b"COLLISION": "collision_count",
+}
+
+
+class _JsonLineFormatter(logging.Formatter):
+    """
+    Format each record as one compact JSON object per line.
+    
+    Keys are time, name, level, event (only when the record carries one, via
+    extra={'event': ...}) and message, always in that order.
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': self.formatTime(record, self.datefmt),
+            'name': record.name,
+            'level': record.levelname,
+        }
+        event = getattr(record, 'event', None)
+        if event:
+            entry['event'] = event
+        entry['message'] = record.getMessage()
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, separators=(',', ':'), default=str)
+
+
 def setup_logging(log_level: str = "INFO", log_to_file: bool = True) -> logging.Logger:
     """
     Setup general application logging (separate from AI decision logging).
@@ -30,24 +91,29 @@ def setup_logging(log_level: str = "INFO", log_to_file: bool = True) -> logging.
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
     
+    global _log_listener
+    
     # Create general logger
-    logger = logging.getLogger('airport_simulation')
+    logger = _default_logger
     logger.setLevel(getattr(logging, log_level.upper()))
     
-    # Clear any existing handlers
+    # Clear any existing handlers, draining the previous listener first
+    stop_logging()
     logger.handlers.clear()
     
-    # Create formatter
+    # Create formatters: readable lines on the console, JSON lines in the file
+    # so get_log_summary() can match fixed fields
     formatter = logging.Formatter(
         '%(asctime)s | %(name)s | %(levelname)s | %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
+    json_formatter = _JsonLineFormatter(datefmt='%Y-%m-%d %H:%M:%S')
     
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(getattr(logging, log_level.upper()))
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler (if enabled)
     if log_to_file:
@@ -55,8 +121,15 @@ def setup_logging(log_level: str = "INFO", log_to_file: bool = True) -> logging.
         log_filename = os.path.join(log_dir, f"simulation_{timestamp}.log")
         file_handler = logging.FileHandler(log_filename)
         file_handler.setLevel(getattr(logging, log_level.upper()))
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(json_formatter)
+        handlers.append(file_handler)
+    
+    # The logger only enqueues records; console and file writes happen on the
+    # listener thread so they never block the simulation loop
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
     
     # Prevent propagation to avoid duplicate logs
     logger.propagate = False
@@ -64,6 +137,24 @@ def setup_logging(log_level: str = "INFO", log_to_file: bool = True) -> logging.
     return logger
 
 
+def stop_logging() -> None:
+    """
+    Stop the background logging thread after it writes out queued records.
+    
+    Called automatically at interpreter exit.
+    """
+    global _log_listener
+    
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
+atexit.register(stop_logging)
+
+
 def log_aircraft_decision(aircraft: Aircraft, decision: Dict[str, Any], reasoning: str, logger: Optional[logging.Logger] = None):
     """
     Log an aircraft decision for debugging and analysis.
@@ -75,19 +166,21 @@ def log_aircraft_decision(aircraft: Aircraft, decision: Dict[str, Any], reasonin
         logger (Optional[logging.Logger]): Logger to use (creates default if None)
     """
     if logger is None:
-        logger = logging.getLogger('airport_simulation')
+        logger = _default_logger
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
-    decision_info = {
-        'aircraft_id': aircraft.id,
-        'callsign': aircraft.callsign,
-        'state': aircraft.state.value,
-        'fuel': f"{aircraft.fuel:.1f}%",
-        'position': f"({aircraft.position.x:.0f}, {aircraft.position.y:.0f})",
-        'decision': decision,
-        'reasoning': reasoning
-    }
-    
-    logger.info(f"AIRCRAFT DECISION: {decision_info}")
+    position = aircraft.position
+    logger.info("AIRCRAFT DECISION: %s", _DECISION_TMPL.format(
+        id=aircraft.id,
+        callsign=aircraft.callsign,
+        state=aircraft.state.value,
+        fuel=aircraft.fuel,
+        posx=position.x,
+        posy=position.y,
+        decision=decision,
+        why=reasoning
+    ), extra={'event': 'DECISION'})
 
 
 def log_crash(aircraft: Aircraft, crash_reason: str, details: Dict[str, Any], logger: Optional[logging.Logger] = None):
@@ -101,7 +194,9 @@ def log_crash(aircraft: Aircraft, crash_reason: str, details: Dict[str, Any], lo
         logger (Optional[logging.Logger]): Logger to use (creates default if None)
     """
     if logger is None:
-        logger = logging.getLogger('airport_simulation')
+        logger = _default_logger
+    if not logger.isEnabledFor(logging.ERROR):
+        return
     
     crash_info = {
         'aircraft_id': aircraft.id,
@@ -116,7 +211,7 @@ def log_crash(aircraft: Aircraft, crash_reason: str, details: Dict[str, Any], lo
         **details
     }
     
-    logger.error(f"AIRCRAFT CRASH: {crash_info}")
+    logger.error("AIRCRAFT CRASH: %s", crash_info, extra={'event': 'CRASH'})
 
 
 def log_performance_metrics(metrics: Dict[str, Any], logger: Optional[logging.Logger] = None):
@@ -128,9 +223,9 @@ def log_performance_metrics(metrics: Dict[str, Any], logger: Optional[logging.Lo
         logger (Optional[logging.Logger]): Logger to use (creates default if None)
     """
     if logger is None:
-        logger = logging.getLogger('airport_simulation')
+        logger = _default_logger
     
-    logger.info(f"PERFORMANCE METRICS: {metrics}")
+    logger.info("PERFORMANCE METRICS: %s", metrics, extra={'event': 'PERFORMANCE'})
 
 
 def log_system_event(event_type: str, message: str, details: Optional[Dict[str, Any]] = None, logger: Optional[logging.Logger] = None):
@@ -144,13 +239,13 @@ def log_system_event(event_type: str, message: str, details: Optional[Dict[str,
         logger (Optional[logging.Logger]): Logger to use (creates default if None)
     """
     if logger is None:
-        logger = logging.getLogger('airport_simulation')
+        logger = _default_logger
     
     log_message = f"{event_type}: {message}"
     if details:
         log_message += f" | Details: {details}"
     
-    logger.info(log_message)
+    logger.info(log_message, extra={'event': 'SYSTEM'})
 
 
 def log_fuel_emergency(aircraft: Aircraft, emergency_level: str, logger: Optional[logging.Logger] = None):
@@ -163,7 +258,9 @@ def log_fuel_emergency(aircraft: Aircraft, emergency_level: str, logger: Optiona
         logger (Optional[logging.Logger]): Logger to use (creates default if None)
     """
     if logger is None:
-        logger = logging.getLogger('airport_simulation')
+        logger = _default_logger
+    if not logger.isEnabledFor(logging.WARNING):
+        return
     
     emergency_info = {
         'aircraft_id': aircraft.id,
@@ -176,7 +273,7 @@ def log_fuel_emergency(aircraft: Aircraft, emergency_level: str, logger: Optiona
         'assigned_gate': aircraft.assigned_gate
     }
     
-    logger.warning(f"FUEL EMERGENCY: {emergency_info}")
+    logger.warning("FUEL EMERGENCY: %s", emergency_info, extra={'event': 'FUEL_EMERGENCY'})
 
 
 def log_collision_event(aircraft1: Aircraft, aircraft2: Aircraft, event_type: str, logger: Optional[logging.Logger] = None):
@@ -190,7 +287,9 @@ def log_collision_event(aircraft1: Aircraft, aircraft2: Aircraft, event_type: st
         logger (Optional[logging.Logger]): Logger to use (creates default if None)
     """
     if logger is None:
-        logger = logging.getLogger('airport_simulation')
+        logger = _default_logger
+    if not logger.isEnabledFor(logging.ERROR if event_type == "COLLISION" else logging.WARNING):
+        return
     
     distance = aircraft1.distance_to(aircraft2)
     collision_info = {
@@ -211,14 +310,37 @@ def log_collision_event(aircraft1: Aircraft, aircraft2: Aircraft, event_type: st
     }
     
     if event_type == "COLLISION":
-        logger.error(f"COLLISION EVENT: {collision_info}")
+        logger.error("COLLISION EVENT: %s", collision_info, extra={'event': 'COLLISION'})
     else:
-        logger.warning(f"COLLISION {event_type}: {collision_info}")
+        logger.warning("COLLISION %s: %s", event_type, collision_info,
+                       extra={'event': f"COLLISION_{event_type}"})
+
+
+def _count_occurrences(mm: mmap.mmap, marker: bytes) -> int:
+    """
+    Count non-overlapping occurrences of marker in a memory-mapped file.
+    
+    mmap only gained count() in Python 3.13, so this steps through find().
+    
+    Args:
+        mm (mmap.mmap): Mapped file contents
+        marker (bytes): Byte string to count
+        
+    Returns:
+        int: Number of occurrences
+    """
+    count = 0
+    step = len(marker)
+    position = mm.find(marker)
+    while position != -1:
+        count += 1
+        position = mm.find(marker, position + step)
+    return count
 
 
 def get_log_summary(log_file_path: str) -> Dict[str, Any]:
     """
-    Generate a summary of events from a log file.
+    Generate a summary of events from a JSON-lines log file.
     
     Args:
         log_file_path (str): Path to the log file to analyze
@@ -240,23 +362,26 @@ def get_log_summary(log_file_path: str) -> Dict[str, Any]:
     }
     
     try:
-        with open(log_file_path, 'r') as f:
-            for line in f:
-                summary["total_lines"] += 1
-                
-                if "ERROR" in line:
-                    summary["error_count"] += 1
-                elif "WARNING" in line:
-                    summary["warning_count"] += 1
-                elif "INFO" in line:
-                    summary["info_count"] += 1
+        with open(log_file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return summary  # mmap cannot map an empty file
+            
+            # Scan the whole mapped file in C instead of parsing each line in
+            # Python. Levels and events are matched on their JSON fields, so
+            # each line is counted at most once per group.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                summary["total_lines"] = _count_occurrences(mm, b"\n")
+                if mm[-1:] != b"\n":
+                    summary["total_lines"] += 1  # Last line has no newline
                 
-                if "AIRCRAFT CRASH" in line:
-                    summary["crash_count"] += 1
-                elif "FUEL EMERGENCY" in line:
-                    summary["fuel_emergency_count"] += 1
-                elif "COLLISION" in line:
-                    summary["collision_count"] += 1
+                # One regex pass picks up each line's level and event fields
+                for match in _SUMMARY_PATTERN.finditer(mm):
+                    level, event = match.groups()
+                    level_key = _SUMMARY_COUNTERS.get(level)
+                    if level_key:
+                        summary[level_key] += 1
+                    if event:
+                        summary[_SUMMARY_COUNTERS[event]] += 1
     
     except Exception as e:
         summary["error"] = f"Failed to read log file: {e}"
@@ -6,13 +6,42 @@ the simulation including distance calculations, vector operations,
 and geometric functions.
 """
 
-import math
+from math import atan2, cos, hypot, pi, sin, sqrt
 import random
-from typing import Tuple
+from typing import Final, Iterable, Tuple
+
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
 
 from models.position import Position
 
 
+_TWO_PI: Final = 2 * pi
+_DEG2RAD: Final = pi / 180.0
+_RAD2DEG: Final = 180.0 / pi
+
+# Unit vectors (cos, sin) for 1024 evenly spaced angles, indexed by
+# random.getrandbits(ANGLE_TABLE_BITS) so picking a random point on a circle
+# needs no cos/sin calls
+ANGLE_TABLE_BITS: Final = 10
+ANGLE_TABLE: Final = tuple(
+    (cos(_TWO_PI * i / (1 << ANGLE_TABLE_BITS)), sin(_TWO_PI * i / (1 << ANGLE_TABLE_BITS)))
+    for i in range(1 << ANGLE_TABLE_BITS)
+)
+
+# Below this many points a dense pairwise check beats building a k-d tree
+_KDTREE_MIN_POINTS: Final = 32
+
+# Private generator for the samplers below, so they don't share the global
+# random module state; callers on other threads can pass their own
+_rng = random.Random()
+
+
 def distance(pos1: Position, pos2: Position) -> float:
     """
     Calculate Euclidean distance between two positions.
@@ -24,7 +53,7 @@ def distance(pos1: Position, pos2: Position) -> float:
     Returns:
         float: Distance between the positions
     """
-    return math.sqrt((pos1.x - pos2.x)**2 + (pos1.y - pos2.y)**2)
+    return hypot(pos1.x - pos2.x, pos1.y - pos2.y)
 
 
 def distance_coords(x1: float, y1: float, x2: float, y2: float) -> float:
@@ -40,7 +69,43 @@ def distance_coords(x1: float, y1: float, x2: float, y2: float) -> float:
     Returns:
         float: Distance between the points
     """
-    return math.sqrt((x1 - x2)**2 + (y1 - y2)**2)
+    return hypot(x1 - x2, y1 - y2)
+
+
+def distance_sq(pos1: Position, pos2: Position) -> float:
+    """
+    Calculate squared Euclidean distance between two positions.
+    
+    Skips the square root; compare the result against a squared threshold.
+    
+    Args:
+        pos1 (Position): First position
+        pos2 (Position): Second position
+        
+    Returns:
+        float: Squared distance between the positions
+    """
+    dx = pos1.x - pos2.x
+    dy = pos1.y - pos2.y
+    return dx * dx + dy * dy
+
+
+def distance_sq_coords(x1: float, y1: float, x2: float, y2: float) -> float:
+    """
+    Calculate squared Euclidean distance between two coordinate pairs.
+    
+    Args:
+        x1 (float): X coordinate of first point
+        y1 (float): Y coordinate of first point
+        x2 (float): X coordinate of second point
+        y2 (float): Y coordinate of second point
+        
+    Returns:
+        float: Squared distance between the points
+    """
+    dx = x1 - x2
+    dy = y1 - y2
+    return dx * dx + dy * dy
 
 
 def normalize_vector(x: float, y: float) -> Tuple[float, float]:
@@ -54,7 +119,7 @@ def normalize_vector(x: float, y: float) -> Tuple[float, float]:
     Returns:
         Tuple[float, float]: Normalized vector (unit_x, unit_y)
     """
-    length = math.sqrt(x**2 + y**2)
+    length = hypot(x, y)
     if length == 0:
         return 0.0, 0.0
     return x / length, y / length
@@ -93,41 +158,45 @@ def clamp_position(position: Position, width: float, height: float, margin: floa
     return Position(clamped_x, clamped_y)
 
 
-def random_position_in_circle(center: Position, radius: float) -> Position:
+def random_position_in_circle(center: Position, radius: float,
+                              rng: random.Random = _rng) -> Position:
     """
     Generate a random position within a circle.
     
     Args:
         center (Position): Center of the circle
         radius (float): Radius of the circle
+        rng (random.Random): Random number generator to draw from
         
     Returns:
         Position: Random position within the circle
     """
-    angle = random.uniform(0, 2 * math.pi)
-    # Use sqrt for uniform distribution within circle
-    distance = random.uniform(0, radius) * math.sqrt(random.random())
+    angle = rng.random() * _TWO_PI
+    # sqrt of a uniform sample spreads points evenly over the circle's area
+    distance = radius * sqrt(rng.random())
     
-    x = center.x + distance * math.cos(angle)
-    y = center.y + distance * math.sin(angle)
+    x = center.x + distance * cos(angle)
+    y = center.y + distance * sin(angle)
     
     return Position(x, y)
 
 
-def random_position_on_circle(center: Position, radius: float) -> Position:
+def random_position_on_circle(center: Position, radius: float,
+                              rng: random.Random = _rng) -> Position:
     """
     Generate a random position on the circumference of a circle.
     
     Args:
         center (Position): Center of the circle
         radius (float): Radius of the circle
+        rng (random.Random): Random number generator to draw from
         
     Returns:
         Position: Random position on the circle circumference
     """
-    angle = random.uniform(0, 2 * math.pi)
-    x = center.x + radius * math.cos(angle)
-    y = center.y + radius * math.sin(angle)
+    angle = rng.random() * _TWO_PI
+    x = center.x + radius * cos(angle)
+    y = center.y + radius * sin(angle)
     
     return Position(x, y)
 
@@ -145,7 +214,7 @@ def angle_between_positions(pos1: Position, pos2: Position) -> float:
     """
     dx = pos2.x - pos1.x
     dy = pos2.y - pos1.y
-    return math.atan2(dy, dx)
+    return atan2(dy, dx)
 
 
 def lerp(start: float, end: float, t: float) -> float:
@@ -190,7 +259,7 @@ def degrees_to_radians(degrees: float) -> float:
     Returns:
         float: Angle in radians
     """
-    return degrees * math.pi / 180.0
+    return degrees * _DEG2RAD
 
 
 def radians_to_degrees(radians: float) -> float:
@@ -203,4 +272,47 @@ def radians_to_degrees(radians: float) -> float:
     Returns:
         float: Angle in degrees
     """
-    return radians * 180.0 / math.pi 
\ No newline at end of file
+    return radians * _RAD2DEG
+
+
+def positions_to_xy(positions: Iterable[Position]) -> np.ndarray:
+    """
+    Convert positions to an (N, 2) array of coordinates.
+    
+    Args:
+        positions (Iterable[Position]): Positions to convert
+        
+    Returns:
+        np.ndarray: Array of (x, y) rows
+    """
+    return np.array([(p.x, p.y) for p in positions], dtype=np.float64).reshape(-1, 2)
+
+
+def pairs_within(xy: np.ndarray, radius: float) -> np.ndarray:
+    """
+    Find all index pairs of points at most radius apart.
+    
+    Uses scipy's k-d tree when available and the point count is large
+    enough to pay for building it, otherwise a dense pairwise check.
+    
+    Args:
+        xy (np.ndarray): (N, 2) array of coordinates
+        radius (float): Maximum distance between paired points
+        
+    Returns:
+        np.ndarray: (K, 2) array of index pairs (i, j) with i < j,
+            sorted by i then j
+    """
+    n = len(xy)
+    if n < 2:
+        return np.empty((0, 2), dtype=np.intp)
+    
+    if SCIPY_AVAILABLE and n >= _KDTREE_MIN_POINTS:
+        pairs = cKDTree(xy).query_pairs(radius, output_type='ndarray')
+        order = np.lexsort((pairs[:, 1], pairs[:, 0]))
+        return pairs[order]
+    
+    diff = xy[:, np.newaxis, :] - xy[np.newaxis, :, :]
+    dist_sq = np.einsum('ijk,ijk->ij', diff, diff)
+    i, j = np.nonzero(np.triu(dist_sq <= radius * radius, k=1))
+    return np.column_stack((i, j))